@@ -1,9 +1,18 @@
+import os
+import json
 import streamlit as st
+import numpy as np
 import pandas as pd
 import time
 import plotly.express as px
-from core.parser import extract_text
-from core.analyzer import rank_candidates
+from core.parser import EXTRACTION_MODES
+from core.cache import ExtractionCache
+from core.pipeline import iter_rank_candidates, rank_files_matrix
+from core.analyzer import matrix_result, matrix_scores, top_per_job
+from core.vectorizer import VECTORIZER_MODES, CorpusVectorizer, get_vectorizer
+from core.dedup import DuplicateDetector
+from core.results import ResultStore, SORT_COLUMNS
+from core.profiling import Profiler, use_profiler
 from core.utils import clean_text
 
 # 1. Page Configuration
@@ -25,11 +34,109 @@ def load_styles():
 
 load_styles()
 
-# 3. State Management
+# 3. Persistent Extraction Cache (shared across sessions)
+@st.cache_resource
+def get_extraction_cache():
+    return ExtractionCache()
+
+# Fitted corpus vectorizer, reloaded from disk at startup when one was saved
+@st.cache_resource
+def get_corpus_vectorizer():
+    return get_vectorizer("corpus")
+
+# 4. State Management
 if 'shortlist' not in st.session_state:
     st.session_state.shortlist = []
-if 'analysis_results' not in st.session_state:
-    st.session_state.analysis_results = None
+if 'results' not in st.session_state:
+    st.session_state.results = None
+if 'perf_report' not in st.session_state:
+    st.session_state.perf_report = None
+if 'requisitions' not in st.session_state:
+    st.session_state.requisitions = None
+
+def candidate_picker(label, store, scores, default_rows, key, blind, index=0):
+    """Search box plus a selectbox over at most 50 matching candidates; returns a row or None."""
+    query = st.text_input(f"Find {label}", key=f"{key}_query", placeholder="Search by ID or file name")
+    rows = [int(r) for r in (store.search(query) if query.strip() else default_rows[:50])]
+    if not rows:
+        st.info("No candidates match that search.")
+        return None
+    return st.selectbox(
+        label, rows, key=key, index=min(index, len(rows) - 1),
+        format_func=lambda r: f"{store.candidate_id(r)} · {'Candidate (Hidden)' if blind else store.names[r]} · {scores[r]}%"
+    )
+
+def requisition_store(requisitions, job):
+    """ResultStore of one role of a multi-requisition run, built from the score matrix on first use."""
+    stores = requisitions["stores"]
+    if job not in stores:
+        matrix = requisitions["matrix"]
+        store = ResultStore()
+        for row, (idx, file_name) in enumerate(matrix["candidates"]):
+            store.add(idx, file_name, matrix_result(matrix, row, job))
+            for copy in matrix["duplicates"].get(idx, ()):
+                store.add_duplicate(idx, copy)
+        stores[job] = store
+    return stores[job]
+
+def render_requisition_overview(requisitions, store, weights, blind):
+    """Best-fitting role per candidate and the top candidates per role, straight from the score matrices."""
+    titles = requisitions["titles"]
+    matrix = requisitions["matrix"]
+    # Re-weighted for the current sliders without touching a single resume
+    scores = matrix_scores(matrix, weights)
+    best = scores.argmax(axis=1)
+    best_scores = scores[np.arange(len(best)), best]
+
+    with st.expander("🗂️ Requisition Overview", expanded=True):
+        summary_df = pd.DataFrame({
+            "Role": titles,
+            "Required Skills": [len(job["keywords"]) for job in matrix["jobs"]],
+            "Years Required": [job["exp_info"]["years"] for job in matrix["jobs"]],
+            "Best-Fit Candidates": np.bincount(best, minlength=len(titles)),
+            "Top Score": scores.max(axis=0),
+            "Avg. Match": np.round(scores.mean(axis=0), 1)
+        })
+        st.dataframe(summary_df, use_container_width=True, hide_index=True)
+
+        tab_best, tab_top = st.tabs(["🎯 Best Role per Candidate", "🏆 Top Candidates per Role"])
+        with tab_best:
+            order = np.argsort(-best_scores, kind="stable")
+            page_size = 50
+            pages = max(1, -(-len(order) // page_size))
+            if st.session_state.get("req_page", 1) > pages:
+                st.session_state.req_page = pages
+            page = st.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, key="req_page")
+            rows = order[(page - 1) * page_size:page * page_size]
+            best_df = pd.DataFrame({
+                "ID": [store.candidate_id(r) for r in rows],
+                "Name": ["Candidate (Hidden)" if blind else store.names[r] for r in rows],
+                "Best Role": [titles[best[r]] for r in rows],
+                "Score": best_scores[rows]
+            })
+            for j, title in enumerate(titles):
+                best_df[title] = scores[rows, j]
+            st.dataframe(
+                best_df, use_container_width=True, hide_index=True,
+                column_config={"Score": st.column_config.ProgressColumn("Best Fit", format="%d%%", min_value=0, max_value=100)}
+            )
+        with tab_top:
+            t_col1, t_col2 = st.columns([2, 1])
+            role = t_col1.selectbox("Role", range(len(titles)), format_func=titles.__getitem__, key="req_top_role")
+            k = t_col2.slider("Top K", 1, min(50, len(store)), min(10, len(store)), key="req_top_k") if len(store) > 1 else 1
+            rows = top_per_job(scores, k)[role]
+            st.dataframe(
+                pd.DataFrame({
+                    "ID": [store.candidate_id(r) for r in rows],
+                    "Name": ["Candidate (Hidden)" if blind else store.names[r] for r in rows],
+                    "Score": scores[rows, role],
+                    "Matched Skills": matrix["matched"][rows, role],
+                    "Missing Skills": matrix["missing"][rows, role],
+                    "Best Role": [titles[best[r]] for r in rows]
+                }),
+                use_container_width=True, hide_index=True,
+                column_config={"Score": st.column_config.ProgressColumn("Fit Confidence", format="%d%%", min_value=0, max_value=100)}
+            )
 
 def main():
     # Modern Executive Header
@@ -53,6 +160,9 @@ def main():
         </div>
     """, unsafe_allow_html=True)
 
+    # Live leaderboard shown while an analysis is still streaming in
+    live_board = st.empty()
+
     # Sidebar: Campaign Management
     with st.sidebar:
         st.markdown("<h3 style='color: var(--text-primary);'>Campaign Configuration</h3>", unsafe_allow_html=True)
@@ -63,7 +173,36 @@ def main():
             exp_weight = st.slider("Experience Level", 0, 100, 30)
             edu_weight = st.slider("Education Value", 0, 100, 20)
         
+        with st.expander("⚙️ Processing Engine", expanded=False):
+            parse_workers = st.number_input("Parsing Workers", min_value=1, max_value=max(1, os.cpu_count() or 1), value=max(1, os.cpu_count() or 1))
+            parse_timeout = st.number_input("Per-File Timeout (s)", min_value=5, max_value=300, value=30)
+            extraction_mode = st.selectbox("Extraction Mode", EXTRACTION_MODES, format_func=str.title,
+                                           help="Fast skips PDF layout analysis, streams DOCX XML and only reads the first pages.")
+            vectorizer_mode = st.selectbox("Vectorizer", VECTORIZER_MODES, format_func=str.title,
+                                           help="Pairwise fits TF-IDF per resume, Corpus fits once on the pool and saves it, Hashing is stateless with fixed memory.")
+            refit_vectorizer = False
+            if vectorizer_mode == "corpus":
+                corpus_vectorizer = get_corpus_vectorizer()
+                if corpus_vectorizer.fitted:
+                    st.caption(f"Saved vocabulary: {corpus_vectorizer.vocabulary_size:,} terms from {corpus_vectorizer.documents:,} resumes.")
+                else:
+                    st.caption("No saved vocabulary yet; it will be fitted on the next pool.")
+                refit_vectorizer = st.toggle("Refit Vocabulary on This Pool", value=False)
+            collapse_duplicates = st.toggle("Collapse Near-Duplicates", value=True,
+                                            help="Score re-applications and PDF/DOCX copies of the same resume once and list them as one candidate.")
+            use_cache = st.toggle("Reuse Cached Extractions", value=True)
+            profile_run = st.toggle("Profile Pipeline Stages", value=False)
+        
         jd_text = st.text_area("Requirements Description", height=200, placeholder="Paste job details here...")
+        requisition_files = st.file_uploader(
+            "Additional Requisitions (.txt, one role per file)",
+            type=["txt"],
+            accept_multiple_files=True,
+            help="Score the pool against several open roles at once; each resume is parsed only once."
+        )
+        roles = ([(job_title, jd_text)] if jd_text else []) + [
+            (os.path.splitext(f.name)[0], f.getvalue().decode("utf-8", errors="ignore")) for f in requisition_files or []
+        ]
         
         uploaded_resumes = st.file_uploader(
             "Resumes (PDF/DOCX)", 
@@ -75,31 +214,90 @@ def main():
         blind_mode = st.toggle("Blind Screening Mode")
         
         if st.button("🚀 Analyze Talent Pool", use_container_width=True, type="primary"):
-            if jd_text and uploaded_resumes:
-                with st.spinner("Analyzing candidate data..."):
-                    all_results = []
+            if roles and uploaded_resumes:
+                # Each run records into its own profiler, so concurrent sessions never mix timings
+                with st.spinner("Analyzing candidate data..."), use_profiler(Profiler()) as profiler:
+                    cache = get_extraction_cache() if use_cache else None
+                    if profile_run:
+                        profiler.enable()
+                    hits_before = cache.hits if cache else 0
+                    if vectorizer_mode == "corpus":
+                        vectorizer = CorpusVectorizer() if refit_vectorizer else get_corpus_vectorizer()
+                        newly_fitted = not vectorizer.fitted
+                    else:
+                        vectorizer = get_vectorizer(vectorizer_mode)
+                        newly_fitted = False
                     progress = st.progress(0)
-                    for idx, file in enumerate(uploaded_resumes):
-                        progress.progress((idx + 1) / len(uploaded_resumes))
-                        text = extract_text(file)
-                        if text:
-                            # Process analysis using the weights provided
-                            analysis = rank_candidates(text, jd_text, weights=(skill_weight, exp_weight, edu_weight))
-                            all_results.append({
-                                "ID": f"C-{1000 + idx}",
-                                "Name": "Candidate (Hidden)" if blind_mode else file.name,
-                                "RawName": file.name,
-                                "Score": analysis['score'],
-                                "Skills": analysis['skills'],
-                                "Missing": analysis['missing_skills'],
-                                "Experience": analysis['experience_match'],
-                                "Level": analysis['seniority_level'],
-                                "Summary": analysis['summary']
-                            })
-                    st.session_state.analysis_results = pd.DataFrame(all_results).sort_values(by="Score", ascending=False)
-                    st.toast("Analysis complete.", icon="📊")
+                    if len(roles) > 1:
+                        # Several roles: one parse per resume, then the whole role x candidate matrix at once
+                        matrix = rank_files_matrix(
+                            uploaded_resumes, [jd for _, jd in roles],
+                            weights=(skill_weight, exp_weight, edu_weight),
+                            max_workers=parse_workers,
+                            timeout=parse_timeout,
+                            cache=cache,
+                            mode=extraction_mode,
+                            vectorizer=vectorizer,
+                            dedup=DuplicateDetector() if collapse_duplicates else None,
+                            on_progress=lambda done, _: progress.progress(done / len(uploaded_resumes))
+                        )
+                        st.session_state.requisitions = {"titles": [title for title, _ in roles], "matrix": matrix, "stores": {}}
+                        # Role pickers from an earlier run may point past the new role list
+                        for key in ("active_role", "req_top_role"):
+                            st.session_state.pop(key, None)
+                        store = requisition_store(st.session_state.requisitions, 0)
+                        stream = ()  # already scored, nothing to stream
+                    else:
+                        st.session_state.requisitions = None
+                        store = ResultStore()
+                        # Stream candidates in as they finish and keep a live leaderboard of the best so far
+                        stream = iter_rank_candidates(
+                            uploaded_resumes, roles[0][1],
+                            weights=(skill_weight, exp_weight, edu_weight),
+                            max_workers=parse_workers,
+                            timeout=parse_timeout,
+                            cache=cache,
+                            mode=extraction_mode,
+                            vectorizer=vectorizer,
+                            dedup=DuplicateDetector() if collapse_duplicates else None
+                        )
+                    last_refresh = 0.0
+                    for done, (idx, file_name, analysis) in enumerate(stream, 1):
+                        progress.progress(done / len(uploaded_resumes))
+                        if analysis is None:
+                            continue
+                        if "duplicate_of" in analysis:
+                            # Fold the copy into its cluster's row instead of adding another
+                            store.add_duplicate(analysis["duplicate_of"], file_name)
+                            continue
+                        store.add(idx, file_name, analysis)
+                        if time.monotonic() - last_refresh > 0.5:
+                            last_refresh = time.monotonic()
+                            live_scores = store.scores((skill_weight, exp_weight, edu_weight))
+                            live_board.dataframe(
+                                store.frame(store.top(live_scores, 10), live_scores, blind_mode)[["ID", "Name", "Score", "Experience", "Level"]],
+                                use_container_width=True,
+                                hide_index=True,
+                                column_config={
+                                    "Score": st.column_config.ProgressColumn(f"Fit Confidence ({done}/{len(uploaded_resumes)} screened)", format="%d%%", min_value=0, max_value=100),
+                                    "Level": "Seniority Class"
+                                }
+                            )
+                    live_board.empty()
+                    if newly_fitted and vectorizer.fitted:
+                        vectorizer.save()
+                        get_corpus_vectorizer.clear()
+
+                    # Raw component scores stay in typed columns so weight changes can re-rank instantly
+                    st.session_state.results = store
+                    st.session_state.perf_report = (profiler.snapshot(), profiler.to_prometheus()) if profile_run else None
+                    if cache:
+                        reused = cache.hits - hits_before
+                        st.toast(f"Analysis complete. {reused}/{len(uploaded_resumes)} resumes served from cache.", icon="📊")
+                    else:
+                        st.toast("Analysis complete.", icon="📊")
             else:
-                st.warning("Please upload resumes and paste a job description.")
+                st.warning("Please upload resumes and paste a job description or add a requisition.")
 
         # Developer Attribution
         st.markdown("---")
@@ -113,16 +311,31 @@ def main():
             </div>
         """, unsafe_allow_html=True)
 
+    # Multi-requisition runs: pick the role the dashboard below ranks for
+    requisitions = st.session_state.requisitions
+    if requisitions is not None:
+        titles = requisitions["titles"]
+        active_role = st.selectbox("Active Requisition", range(len(titles)), format_func=titles.__getitem__, key="active_role")
+        st.session_state.results = requisition_store(requisitions, active_role)
+        if len(st.session_state.results):
+            render_requisition_overview(requisitions, st.session_state.results, (skill_weight, exp_weight, edu_weight), blind_mode)
+
     # Dashboard Rendering
-    if st.session_state.analysis_results is not None:
-        df = st.session_state.analysis_results
+    if st.session_state.results is not None and len(st.session_state.results) == 0:
+        st.warning("None of the uploaded resumes could be parsed.")
+    elif st.session_state.results is not None:
+        # Re-rank the whole pool for the current slider weights in one vectorized pass
+        store = st.session_state.results
+        scores = store.scores((skill_weight, exp_weight, edu_weight))
+        ranked = store.view(scores)
+        collapsed = sum(store.copies) - len(store)
         
         # Dashboard Overview Metrics
         col1, col2, col3, col4 = st.columns(4)
-        col1.metric("Pipeline Size", f"{len(df)} Profiles")
+        col1.metric("Pipeline Size", f"{len(store)} Profiles", delta=f"{collapsed} duplicates collapsed" if collapsed else None, delta_color="off")
         col2.metric("Shortlisted", f"{len(st.session_state.shortlist)} Candidates")
-        col3.metric("Avg. Match", f"{round(df['Score'].mean(), 1)}%")
-        col4.metric("Top Fit ID", df['ID'].iloc[0])
+        col3.metric("Avg. Match", f"{round(float(scores.mean()), 1)}%")
+        col4.metric("Top Fit ID", store.candidate_id(ranked[0]))
 
         st.markdown("<br>", unsafe_allow_html=True)
 
@@ -133,30 +346,56 @@ def main():
 
         with tab_list:
             st.markdown("### Talent Match Leaderboard")
+            # Filtering and sorting run on the typed columns; only the visible page is rendered
+            f_col1, f_col2, f_col3, f_col4 = st.columns([2, 1, 1, 1])
+            search = f_col1.text_input("Search", key="lb_search", placeholder="ID or file name")
+            level_filter = f_col2.multiselect("Seniority", store.levels.values, key="lb_levels")
+            skill_filter = f_col3.selectbox("Has Skill", [""] + sorted(store.skills.values), key="lb_skill", format_func=lambda s: s or "Any")
+            min_score = f_col4.slider("Min. Score", 0, 100, 0, key="lb_min_score")
+            s_col1, s_col2, s_col3, s_col4 = st.columns(4)
+            sort_by = s_col1.selectbox("Sort By", SORT_COLUMNS, key="lb_sort")
+            descending = s_col2.toggle("Descending", value=True, key="lb_desc")
+            page_size = s_col3.selectbox("Rows per Page", (25, 50, 100, 250), key="lb_page_size")
+            view_rows = store.view(scores, sort_by, descending, min_score, level_filter, skill_filter, search)
+            pages = max(1, -(-len(view_rows) // page_size))
+            if st.session_state.get("lb_page", 1) > pages:
+                st.session_state.lb_page = pages
+            page = s_col4.number_input(f"Page (of {pages:,})", min_value=1, max_value=pages, key="lb_page")
+            page_rows = view_rows[(page - 1) * page_size:page * page_size]
+
             st.dataframe(
-                df[["ID", "Name", "Score", "Experience", "Level"]],
+                store.frame(page_rows, scores, blind_mode)[["ID", "Name", "Score", "Copies", "Experience", "Level"]],
                 use_container_width=True,
                 hide_index=True,
                 column_config={
                     "Score": st.column_config.ProgressColumn("Fit Confidence", format="%d%%", min_value=0, max_value=100),
+                    "Copies": st.column_config.NumberColumn("Copies", help="Near-duplicate submissions collapsed into this row"),
                     "Level": "Seniority Class"
                 }
             )
             
+            st.caption(f"{len(view_rows):,} of {len(store):,} candidates match")
+            
             st.markdown("<br>", unsafe_allow_html=True)
-            selected_id = st.selectbox("Select Candidate for Deep Insight", df["ID"])
-            row = df[df["ID"] == selected_id].iloc[0]
+            selected_row = candidate_picker("Select Candidate for Deep Insight", store, scores, page_rows if len(page_rows) else ranked, "insight", blind_mode)
+            # An empty search falls back to the top-ranked candidate
+            row = store.record(ranked[0] if selected_row is None else selected_row, scores, blind_mode)
             
             p_col1, p_col2 = st.columns([2, 1])
             with p_col1:
                 # Pill logic for Strengths and Gaps
                 skills_html = "".join([f"<span class='pill pill-success'>{s}</span>" for s in row['Skills']])
                 missing_html = "".join([f"<span class='pill pill-danger'>{s}</span>" for s in row['Missing']])
+                duplicates_html = ""
+                if row['Copies'] > 1:
+                    copies = f"{row['Copies'] - 1} more submission(s)" if blind_mode else ", ".join(row['Duplicates'])
+                    duplicates_html = f"<p style='font-size: 0.85rem; color: var(--text-muted);'>🗂️ Also submitted as: {copies}</p>"
 
                 st.markdown(f"""
                     <div class='talent-card'>
                         <h4 style='margin-top:0; color: var(--text-primary); border-bottom: 2px solid var(--card-border); padding-bottom: 10px;'>Analysis: {row['Name']}</h4>
                         <p style='font-size: 1rem; line-height: 1.6; color: var(--text-secondary); padding-top: 10px;'>{row['Summary']}</p>
+                        {duplicates_html}
                         
                         <div style='margin-top: 25px;'>
                             <p style='font-weight: 700; color: var(--text-primary); margin-bottom: 12px; font-size: 0.9rem;'>✅ IDENTIFIED STRENGTHS</p>
@@ -196,8 +435,8 @@ def main():
             st.markdown("### Talent Comparison Matrix")
             col_a, col_b = st.columns(2)
             with col_a:
-                c1_id = st.selectbox("Subject A", df["ID"], key="ca_1")
-                c1 = df[df["ID"] == c1_id].iloc[0]
+                c1_row = candidate_picker("Subject A", store, scores, ranked, "ca_1", blind_mode)
+                c1 = store.record(ranked[0] if c1_row is None else c1_row, scores, blind_mode)
                 st.markdown(f"""
                     <div class='talent-card'>
                         <h2 style='color: var(--accent-primary); margin: 0;'>{c1['Score']}%</h2>
@@ -207,8 +446,8 @@ def main():
                     </div>
                 """, unsafe_allow_html=True)
             with col_b:
-                c2_id = st.selectbox("Subject B", df["ID"], key="ca_2", index=min(1, len(df)-1))
-                c2 = df[df["ID"] == c2_id].iloc[0]
+                c2_row = candidate_picker("Subject B", store, scores, ranked, "ca_2", blind_mode, index=1)
+                c2 = store.record(ranked[min(1, len(ranked) - 1)] if c2_row is None else c2_row, scores, blind_mode)
                 st.markdown(f"""
                     <div class='talent-card'>
                         <h2 style='color: var(--accent-primary); margin: 0;'>{c2['Score']}%</h2>
@@ -222,19 +461,24 @@ def main():
             st.markdown("### Recruitment Data Insights")
             a_col1, a_col2 = st.columns(2)
             with a_col1:
-                fig1 = px.histogram(df, x="Score", nbins=10, title="Match Distribution", 
-                                   color_discrete_sequence=['#1d4ed8'], template="plotly_white")
+                # Binned here so the browser gets 10 bars, not one point per candidate
+                counts, edges = np.histogram(scores, bins=10, range=(0, 100))
+                fig1 = px.bar(x=[f"{lo:.0f}-{hi:.0f}" for lo, hi in zip(edges[:-1], edges[1:])], y=counts,
+                              labels={"x": "Score", "y": "Candidates"}, title="Match Distribution",
+                              color_discrete_sequence=['#1d4ed8'], template="plotly_white")
                 fig1.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
                 st.plotly_chart(fig1, use_container_width=True)
             with a_col2:
-                fig2 = px.pie(df, names="Level", title="Experience Composition", hole=.4, 
+                level_counts = store.level_counts()
+                fig2 = px.pie(names=list(level_counts), values=list(level_counts.values()), title="Experience Composition", hole=.4, 
                              color_discrete_sequence=px.colors.qualitative.Bold)
                 fig2.update_layout(paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)')
                 st.plotly_chart(fig2, use_container_width=True)
 
         with tab_shortlist:
             if st.session_state.shortlist:
-                s_df = df[df["ID"].isin(st.session_state.shortlist)]
+                shortlisted = [r for r in map(store.row_of, st.session_state.shortlist) if r is not None]
+                s_df = store.frame(shortlisted, scores, blind_mode)
                 st.markdown("### Executive Talent Selection")
                 st.dataframe(s_df[["ID", "Name", "Score", "Level"]], use_container_width=True, hide_index=True)
                 
@@ -248,6 +492,35 @@ def main():
             else:
                 st.info("No candidates selected yet. Review the Ranking Matrix to build your pool.")
 
+        # Per-stage timings from the last profiled analysis
+        if st.session_state.perf_report is not None:
+            snapshot, prometheus_text = st.session_state.perf_report
+            with st.expander("⏱️ Performance", expanded=False):
+                stages_df = pd.DataFrame([
+                    {"Stage": name, "Calls": agg["calls"], "Total (s)": round(agg["seconds"], 3),
+                     "Mean (ms)": agg["mean_ms"], "Max (ms)": agg["max_ms"], "Bytes": agg["bytes"]}
+                    for name, agg in snapshot["stages"].items()
+                ])
+                if not stages_df.empty:
+                    stages_df = stages_df.sort_values(by="Total (s)", ascending=False)
+                st.dataframe(stages_df, use_container_width=True, hide_index=True)
+
+                if snapshot["counters"]:
+                    counter_cols = st.columns(len(snapshot["counters"]))
+                    for col, (name, value) in zip(counter_cols, sorted(snapshot["counters"].items())):
+                        col.metric(name.replace("_", " ").title(), value)
+
+                slow_parse = snapshot["slowest"].get("parse", [])
+                if slow_parse:
+                    st.markdown("**Slowest Documents to Parse**")
+                    st.dataframe(pd.DataFrame(slow_parse), use_container_width=True, hide_index=True)
+
+                e_col1, e_col2 = st.columns(2)
+                e_col1.download_button("📥 Export JSON", json.dumps(snapshot, indent=2), "pipeline_profile.json",
+                                       "application/json", use_container_width=True)
+                e_col2.download_button("📥 Export Prometheus", prometheus_text, "pipeline_profile.prom",
+                                       "text/plain", use_container_width=True)
+
     else:
         # Professional Hero Section for Empty State
         st.markdown(f"""
@@ -0,0 +1 @@
+"""Micro-benchmarks for the screening pipeline. Run modules with `python -m benchmarks.<name>`."""
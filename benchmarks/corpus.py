@@ -0,0 +1,168 @@
+"""
+Deterministic synthetic resume and job description generator.
+
+    python -m benchmarks.corpus OUT_DIR --count 1000 --format mix --words 400 --jds 3 --jd-words 300
+
+Every document is derived from (seed, index) alone, so the same arguments
+always produce byte-identical files and a pool of 1k is a prefix of a pool
+of 10k. PDFs are written directly (no extra dependency), DOCX files through
+python-docx.
+"""
+import io
+import os
+import random
+import argparse
+import zipfile
+import textwrap
+import datetime
+import docx
+from core.skills import load_taxonomy
+
+FORMATS = ("pdf", "docx")
+
+_FILLER = (
+    "delivered built designed led owned improved migrated scaled automated shipped "
+    "platform service pipeline product feature team customers stakeholders roadmap "
+    "performance reliability latency cost quality the and with for across using "
+    "reduced increased launched mentored partnered production internal external"
+).split()
+_EPOCH = datetime.datetime(2024, 1, 1)
+_LEVELS = ("Junior", "Mid-level", "Senior", "Staff", "Principal")
+_DEGREES = ("BSc Computer Science", "MSc Data Science", "BEng Software Engineering", "MBA", "PhD Machine Learning")
+
+def _skills(rng, count):
+    vocab = list(load_taxonomy())
+    return rng.sample(vocab, min(count, len(vocab)))
+
+def _sentence(rng, skills, words):
+    return " ".join(rng.choice(skills) if rng.random() < 0.15 else rng.choice(_FILLER) for _ in range(words)).capitalize() + "."
+
+def resume_text(index, words=400, seed=0):
+    """Plain text of synthetic resume number `index`, roughly `words` words long."""
+    rng = random.Random(seed * 1_000_003 + index)
+    skills = _skills(rng, rng.randint(6, 18))
+    years = rng.randint(0, 15)
+    lines = [
+        f"Candidate {index:05d}",
+        f"{rng.choice(_LEVELS)} Software Engineer with {years}+ years of experience.",
+        "",
+        "EXPERIENCE",
+    ]
+    remaining = words - 40
+    while remaining > 0:
+        n = rng.randint(8, 20)
+        lines.append("- " + _sentence(rng, skills, n))
+        remaining -= n
+    lines += ["", "SKILLS", ", ".join(skills), "", "EDUCATION", rng.choice(_DEGREES)]
+    return "\n".join(lines)
+
+def job_description(index=0, words=150, seed=0):
+    """Plain text of synthetic job description number `index`."""
+    rng = random.Random(seed * 1_000_003 + 999_983 + index)
+    skills = _skills(rng, rng.randint(5, 10))
+    lines = [
+        f"{rng.choice(_LEVELS)} Engineer",
+        f"We need {rng.randint(2, 10)}+ years of experience with {', '.join(skills[:-1])} and {skills[-1]}.",
+    ]
+    remaining = words - 20
+    while remaining > 0:
+        n = rng.randint(8, 16)
+        lines.append(_sentence(rng, skills, n))
+        remaining -= n
+    return "\n".join(lines)
+
+def make_docx(text):
+    """DOCX bytes with one paragraph per line of text."""
+    document = docx.Document()
+    document.core_properties.created = _EPOCH
+    document.core_properties.modified = _EPOCH
+    for line in text.split("\n"):
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+
+    # Re-pack with fixed zip timestamps so identical text gives identical bytes
+    out = io.BytesIO()
+    with zipfile.ZipFile(buffer) as src, zipfile.ZipFile(out, "w", zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            dst.writestr(zipfile.ZipInfo(info.filename, date_time=_EPOCH.timetuple()[:6]), src.read(info.filename), zipfile.ZIP_DEFLATED)
+    return out.getvalue()
+
+def make_pdf(text, lines_per_page=50, width=95):
+    """Minimal multi-page PDF (Helvetica, one text object per page)."""
+    lines = []
+    for paragraph in text.split("\n"):
+        lines.extend(textwrap.wrap(paragraph, width) or [""])
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[]]
+
+    # Object numbers: 1 catalog, 2 page tree, 3 font, then (page, content) pairs
+    objects = {}
+    kids = []
+    for n, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * n, 5 + 2 * n
+        kids.append(f"{page_id} 0 R")
+        body = ["BT", "/F1 10 Tf", "12 TL", "50 760 Td"]
+        for line in page_lines:
+            escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+            body.append(f"({escaped.encode('latin-1', 'replace').decode('latin-1')}) Tj T*")
+        body.append("ET")
+        stream = "\n".join(body).encode("latin-1", "replace")
+        objects[page_id] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>"
+        ).encode()
+        objects[content_id] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+    objects[1] = b"<< /Type /Catalog /Pages 2 0 R >>"
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+    objects[3] = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = {}
+    for obj_id in sorted(objects):
+        offsets[obj_id] = out.tell()
+        out.write(b"%d 0 obj\n" % obj_id + objects[obj_id] + b"\nendobj\n")
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for obj_id in sorted(objects):
+        out.write(b"%010d 00000 n \n" % offsets[obj_id])
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+def resume_format(index, fmt="mix"):
+    """File type of resume `index`: fixed, or alternating pdf/docx for "mix"."""
+    return FORMATS[index % 2] if fmt == "mix" else fmt
+
+def iter_resumes(count, fmt="mix", words=400, seed=0):
+    """Yields (file_name, raw_bytes) for `count` synthetic resumes."""
+    for index in range(count):
+        file_type = resume_format(index, fmt)
+        text = resume_text(index, words=words, seed=seed)
+        data = make_pdf(text) if file_type == "pdf" else make_docx(text)
+        yield f"resume_{index:05d}.{file_type}", data
+
+def write_corpus(out_dir, count, fmt="mix", words=400, seed=0, jds=1, jd_words=150):
+    """Writes resumes plus `jds` job descriptions (jd_N.txt) into out_dir."""
+    os.makedirs(out_dir, exist_ok=True)
+    for name, data in iter_resumes(count, fmt=fmt, words=words, seed=seed):
+        with open(os.path.join(out_dir, name), "wb") as f:
+            f.write(data)
+    for index in range(jds):
+        with open(os.path.join(out_dir, f"jd_{index}.txt"), "w", encoding="utf-8") as f:
+            f.write(job_description(index, words=jd_words, seed=seed))
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a deterministic synthetic resume corpus.")
+    parser.add_argument("out_dir")
+    parser.add_argument("--count", type=int, default=100)
+    parser.add_argument("--format", choices=FORMATS + ("mix",), default="mix")
+    parser.add_argument("--words", type=int, default=400, help="approximate words per resume")
+    parser.add_argument("--jds", type=int, default=1, help="job descriptions to write alongside")
+    parser.add_argument("--jd-words", type=int, default=150, help="approximate words per job description")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_corpus(args.out_dir, args.count, fmt=args.format, words=args.words, seed=args.seed, jds=args.jds, jd_words=args.jd_words)
+    print(f"Wrote {args.count} resumes and {args.jds} job descriptions to {args.out_dir}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,150 @@
+"""
+Load generator for the local scoring service (server.py).
+
+    python -m benchmarks.loadgen --concurrency 32 --requests 2000
+    python -m benchmarks.loadgen --start-server --workers 4 --files
+
+Opens --concurrency keep-alive connections and sends synthetic /score
+requests through them as fast as responses come back, spread over --jds job
+descriptions so the server's micro-batching sees a realistic mix. Reports
+throughput, latency percentiles, how many requests were rejected with 503
+(backpressure) and the server's mean batch size. --start-server launches
+server.py on a free port for the duration of the run.
+"""
+import os
+import sys
+import json
+import time
+import socket
+import base64
+import asyncio
+import argparse
+import subprocess
+import numpy as np
+from benchmarks.corpus import resume_text, job_description, make_pdf, make_docx, resume_format
+
+SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "server.py")
+
+async def _request(reader, writer, host, method, path, payload=None):
+    """One keep-alive HTTP/1.1 exchange; returns (status, decoded JSON body)."""
+    body = json.dumps(payload).encode("utf-8") if payload is not None else b""
+    writer.write(
+        f"{method} {path} HTTP/1.1\r\nHost: {host}\r\nContent-Type: application/json\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin-1") + body
+    )
+    await writer.drain()
+
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        if name.strip().lower() == "content-length":
+            length = int(value)
+    return status, json.loads(await reader.readexactly(length)) if length else None
+
+def build_payloads(count, jds, words, files, seed, jd_words=150):
+    """Distinct /score bodies cycling over `jds` job descriptions."""
+    descriptions = [job_description(i, words=jd_words, seed=seed) for i in range(jds)]
+    payloads = []
+    for i in range(count):
+        text = resume_text(i, words=words, seed=seed)
+        payload = {"job_description": descriptions[i % jds]}
+        if files:
+            fmt = resume_format(i)
+            data = make_pdf(text) if fmt == "pdf" else make_docx(text)
+            payload.update(file_name=f"resume_{i:05d}.{fmt}", file_base64=base64.b64encode(data).decode("ascii"))
+        else:
+            payload["resume_text"] = text
+        payloads.append(payload)
+    return payloads
+
+async def run_load(host, port, payloads, total, concurrency):
+    latencies, statuses = [], {}
+    next_request = iter(range(total))
+
+    async def client():
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for i in next_request:
+                start = time.perf_counter()
+                status, _ = await _request(reader, writer, host, "POST", "/score", payloads[i % len(payloads)])
+                statuses[status] = statuses.get(status, 0) + 1
+                if status == 200:
+                    latencies.append(time.perf_counter() - start)
+        finally:
+            writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client() for _ in range(concurrency)))
+    seconds = time.perf_counter() - start
+
+    reader, writer = await asyncio.open_connection(host, port)
+    _, health = await _request(reader, writer, host, "GET", "/health")
+    writer.close()
+    return latencies, statuses, seconds, health
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def _wait_for(host, port, timeout=30):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection((host, port), timeout=1).close()
+            return
+        except OSError:
+            time.sleep(0.2)
+    raise SystemExit(f"server did not come up on {host}:{port}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Drive the scoring service and report RPS and latency.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8008)
+    parser.add_argument("--requests", type=int, default=2000, help="total requests to send")
+    parser.add_argument("--concurrency", type=int, default=32, help="parallel keep-alive connections")
+    parser.add_argument("--jds", type=int, default=3, help="distinct job descriptions in the mix")
+    parser.add_argument("--words", type=int, default=400, help="approximate words per resume")
+    parser.add_argument("--jd-words", type=int, default=150, help="approximate words per job description")
+    parser.add_argument("--unique", type=int, default=500, help="distinct resumes to cycle through")
+    parser.add_argument("--files", action="store_true", help="send PDF/DOCX files instead of plain text")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--start-server", action="store_true", help="launch server.py on a free port for the run")
+    parser.add_argument("--workers", type=int, default=None, help="server processes with --start-server")
+    args = parser.parse_args()
+
+    payloads = build_payloads(min(args.unique, args.requests), args.jds, args.words, args.files, args.seed, args.jd_words)
+
+    server = None
+    if args.start_server:
+        args.port = _free_port()
+        command = [sys.executable, SERVER_SCRIPT, "--host", args.host, "--port", str(args.port)]
+        if args.workers:
+            command += ["--workers", str(args.workers)]
+        server = subprocess.Popen(command)
+        _wait_for(args.host, args.port)
+    try:
+        latencies, statuses, seconds, health = asyncio.run(
+            run_load(args.host, args.port, payloads, args.requests, args.concurrency)
+        )
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+
+    ok = statuses.get(200, 0)
+    print(f"\nRequests:     {args.requests} over {args.concurrency} connections in {seconds:.2f}s")
+    print(f"Throughput:   {ok / seconds:,.1f} scored req/s ({args.requests / seconds:,.1f} total req/s)")
+    if latencies:
+        p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+        print(f"Latency (ms): p50 {p50:.1f}  p95 {p95:.1f}  p99 {p99:.1f}")
+    print(f"Statuses:     {', '.join(f'{code}: {n}' for code, n in sorted(statuses.items()))}")
+    print(f"Server:       mean batch size {health['mean_batch_size']}, {health['rejected']} rejected, {health['errors']} errors")
+    return 0 if ok else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
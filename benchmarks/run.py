@@ -0,0 +1,212 @@
+"""
+Stage-by-stage benchmark of the screening pipeline on a synthetic corpus.
+
+    python -m benchmarks.run --sizes 10 1000 10000 --output before.json
+    python -m benchmarks.run --sizes 10 1000 10000 --compare before.json
+
+For every pool size the harness times parsing, cleaning, skill extraction,
+vectorization, single-pass normalization, near-duplicate detection, batch,
+streaming and multi-role matrix ranking and the parallel end-to-end
+pipeline, reporting throughput, per-document latency percentiles and peak
+Python heap usage.
+Results are saved as JSON; --compare flags any stage whose throughput
+dropped by more than --tolerance against an earlier run and exits non-zero
+so it can gate CI.
+"""
+import os
+import sys
+import json
+import time
+import platform
+import argparse
+import datetime
+import subprocess
+import tracemalloc
+import numpy as np
+from core.parser import extract_text_from_bytes
+from core.utils import clean_text
+from core.document import parse_document
+from core.dedup import find_duplicates
+from core.analyzer import extract_skills_v2, term_counts, rank_candidates_batch, rank_candidates_matrix, prepare_job, score_resume
+from core.pipeline import iter_rank_candidates
+from benchmarks.corpus import iter_resumes, job_description
+
+DEFAULT_SIZES = (10, 1000, 10000)
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+
+class _MemoryFile:
+    """Upload-like wrapper around in-memory bytes."""
+
+    def __init__(self, name, data):
+        self.name = name
+        self._data = data
+
+    def read(self):
+        return self._data
+
+def _summary(latencies, seconds, items, peak_bytes):
+    result = {
+        "items": items,
+        "seconds": round(seconds, 4),
+        "throughput": round(items / seconds, 2) if seconds > 0 else None,
+        "p50_ms": None,
+        "p95_ms": None,
+        "p99_ms": None,
+        "peak_mb": round(peak_bytes / 2 ** 20, 2) if peak_bytes is not None else None
+    }
+    if latencies:
+        p50, p95, p99 = np.percentile(np.array(latencies) * 1000, [50, 95, 99])
+        result.update(p50_ms=round(p50, 3), p95_ms=round(p95, 3), p99_ms=round(p99, 3))
+    return result
+
+def _peak(fn):
+    """Peak Python heap allocated while running fn, in bytes (a separate, traced run)."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def per_item(fn, items, memory=True):
+    """Times fn on each item; returns the stage summary and the outputs."""
+    if items:
+        fn(items[0])  # warm up lazily compiled state (skill trie, stop-word sets)
+    outputs, latencies = [], []
+    start = time.perf_counter()
+    for item in items:
+        t = time.perf_counter()
+        outputs.append(fn(item))
+        latencies.append(time.perf_counter() - t)
+    seconds = time.perf_counter() - start
+    peak = _peak(lambda: [fn(item) for item in items]) if memory else None
+    return _summary(latencies, seconds, len(items), peak), outputs
+
+def whole_pool(fn, items, memory=True):
+    """Times one call of fn over the whole pool (no per-item latency)."""
+    start = time.perf_counter()
+    fn()
+    seconds = time.perf_counter() - start
+    peak = _peak(fn) if memory else None
+    return _summary(None, seconds, items, peak)
+
+def run_size(files, job_desc, workers=None, parse_limit=0, memory=True, roles=()):
+    """All stage measurements for one pool of (file_name, bytes)."""
+    stages = {}
+    parse_files = files[:parse_limit] if parse_limit else files
+
+    stages["parse"], texts = per_item(lambda f: extract_text_from_bytes(*f), parse_files, memory)
+    # Parse sampling only caps the parse stage; later stages always see the full pool
+    if len(parse_files) < len(files):
+        texts = texts + [extract_text_from_bytes(*f) for f in files[len(parse_files):]]
+    texts = [t or "" for t in texts]
+
+    stages["clean"], cleaned = per_item(clean_text, texts, memory)
+    stages["skills"], _ = per_item(extract_skills_v2, texts, memory)
+    stages["vectorize"], _ = per_item(term_counts, cleaned, memory)
+    stages["normalize"], docs = per_item(parse_document, texts, memory)
+    stages["dedup"] = whole_pool(lambda: find_duplicates(docs), len(docs), memory)
+
+    stages["rank_batch"] = whole_pool(lambda: rank_candidates_batch(texts, job_desc), len(texts), memory)
+    job = prepare_job(job_desc)
+    stages["rank_stream"], _ = per_item(lambda t: score_resume(job, t), texts, memory)
+    if roles:
+        stages["rank_matrix"] = whole_pool(lambda: rank_candidates_matrix(texts, roles), len(texts), memory)
+
+    def end_to_end():
+        for _ in iter_rank_candidates([_MemoryFile(n, d) for n, d in files], job_desc, max_workers=workers):
+            pass
+    # Worker processes are invisible to tracemalloc, so only time this stage
+    stages["end_to_end"] = whole_pool(end_to_end, len(files), memory=False)
+    return stages
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+def compare(current, baseline, tolerance):
+    """Prints a throughput comparison; returns the list of regressed (size, stage) pairs."""
+    regressions = []
+    print(f"\n{'size':>6} {'stage':<12} {'baseline/s':>12} {'current/s':>12} {'change':>8}")
+    for size, stages in current["results"].items():
+        for stage, result in stages.items():
+            old = baseline.get("results", {}).get(size, {}).get(stage)
+            if not old or not old.get("throughput") or not result.get("throughput"):
+                continue
+            change = result["throughput"] / old["throughput"] - 1
+            flag = "  REGRESSION" if change < -tolerance else ""
+            if flag:
+                regressions.append((size, stage))
+            print(f"{size:>6} {stage:<12} {old['throughput']:>12,.1f} {result['throughput']:>12,.1f} {change:>+8.1%}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark each screening stage on a synthetic corpus.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    parser.add_argument("--words", type=int, default=400, help="approximate words per resume")
+    parser.add_argument("--jd-words", type=int, default=150, help="approximate words per job description")
+    parser.add_argument("--format", choices=("pdf", "docx", "mix"), default="mix")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None, help="processes for the end-to-end stage")
+    parser.add_argument("--roles", type=int, default=5, help="job descriptions for the multi-role matrix stage (0 = skip)")
+    parser.add_argument("--parse-limit", type=int, default=0, help="time parsing on at most N files per size (0 = all)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced peak-memory runs")
+    parser.add_argument("--output", help="where to save results (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument("--compare", metavar="BASELINE", help="earlier results JSON to check for regressions")
+    parser.add_argument("--tolerance", type=float, default=0.10, help="allowed throughput drop before flagging")
+    args = parser.parse_args()
+
+    # Smaller pools are prefixes of the largest, so generate once
+    print(f"Generating {max(args.sizes)} synthetic resumes...", file=sys.stderr)
+    corpus = list(iter_resumes(max(args.sizes), fmt=args.format, words=args.words, seed=args.seed))
+    job_desc = job_description(words=args.jd_words, seed=args.seed)
+    roles = [job_description(i, words=args.jd_words, seed=args.seed) for i in range(args.roles)]
+
+    report = {
+        "meta": {
+            "timestamp": datetime.datetime.now().isoformat(timespec="seconds"),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "words": args.words,
+            "jd_words": args.jd_words,
+            "roles": args.roles,
+            "format": args.format,
+            "seed": args.seed,
+            "parse_limit": args.parse_limit
+        },
+        "results": {}
+    }
+    for size in sorted(args.sizes):
+        print(f"Benchmarking pool of {size}...", file=sys.stderr)
+        stages = run_size(corpus[:size], job_desc, workers=args.workers, parse_limit=args.parse_limit, memory=not args.no_memory,
+                           roles=roles)
+        report["results"][str(size)] = stages
+        print(f"\n{'size':>6} {'stage':<12} {'docs/s':>12} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'peak MB':>9}")
+        for stage, r in stages.items():
+            cells = [f"{r[k]:>9}" if r[k] is not None else f"{'-':>9}" for k in ("p50_ms", "p95_ms", "p99_ms", "peak_mb")]
+            print(f"{size:>6} {stage:<12} {r['throughput']:>12,.1f} " + " ".join(cells))
+
+    output = args.output or os.path.join(RESULTS_DIR, f"run-{datetime.datetime.now():%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nSaved results to {output}", file=sys.stderr)
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        regressions = compare(report, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} stage(s) regressed by more than {args.tolerance:.0%}.", file=sys.stderr)
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
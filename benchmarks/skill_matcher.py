@@ -0,0 +1,62 @@
+"""
+Skill matcher throughput as the taxonomy grows.
+
+    python -m benchmarks.skill_matcher
+
+Compares the compiled SkillMatcher against an equivalent regex alternation on
+the same documents for taxonomies of 25 to 5,000 terms. The matcher's docs/s
+should stay flat while the regex degrades with every term added.
+"""
+import re
+import time
+import random
+import argparse
+from core.skills import SkillMatcher, load_taxonomy
+
+SIZES = (25, 250, 1000, 5000)
+
+def synthetic_taxonomy(size, seed=0):
+    """Bundled skills first, padded with random one- and two-word terms up to size."""
+    rng = random.Random(seed)
+    taxonomy = dict(list(load_taxonomy().items())[:size])
+    while len(taxonomy) < size:
+        words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+                 for _ in range(rng.randint(1, 2))]
+        taxonomy[" ".join(words)] = [words[0][:3] + "x" + str(len(taxonomy))]
+    return taxonomy
+
+def synthetic_documents(count, words_per_doc, seed=0):
+    rng = random.Random(seed)
+    vocab = list(load_taxonomy()) + ["engineer", "team", "delivered", "years", "project", "built", "the", "and"]
+    return [" ".join(rng.choice(vocab) for _ in range(words_per_doc)) for _ in range(count)]
+
+def regex_for(taxonomy):
+    terms = sorted({t for skill, aliases in taxonomy.items() for t in [skill] + aliases}, key=len, reverse=True)
+    return re.compile(r"\b(" + "|".join(re.escape(t) for t in terms) + r")\b")
+
+def throughput(fn, docs, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for doc in docs:
+            fn(doc)
+    return len(docs) * repeat / (time.perf_counter() - start)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--docs", type=int, default=200)
+    parser.add_argument("--words", type=int, default=600, help="words per synthetic document")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    docs = synthetic_documents(args.docs, args.words)
+    print(f"{'terms':>6} {'matcher docs/s':>15} {'regex docs/s':>13}")
+    for size in SIZES:
+        taxonomy = synthetic_taxonomy(size)
+        matcher = SkillMatcher(taxonomy)
+        pattern = regex_for(taxonomy)
+        fast = throughput(matcher.match, docs, args.repeat)
+        slow = throughput(lambda doc: set(pattern.findall(doc.lower())), docs, args.repeat)
+        print(f"{size:>6} {fast:>15,.0f} {slow:>13,.0f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Headless batch screener for large resume archives.
+
+    python cli.py RESUME_DIR --jd job.txt --output results.jsonl [--top 100]
+
+Walks RESUME_DIR for PDF/DOCX resumes, streams them through parse -> clean ->
+score on a worker pool and appends every result to the output file (.jsonl or
+.csv) as soon as it is ready. Nothing is accumulated in memory: --top keeps a
+bounded heap of the best N candidates instead of the full result list, and
+the output file doubles as a checkpoint that --resume picks up from after an
+interrupted run.
+
+--vectorizer corpus scores against one TF-IDF model fitted on the whole
+directory (saved to --vectorizer-path and reused by later runs), and
+--vectorizer hashing uses stateless hashed term vectors with fixed memory.
+--dedup scores each cluster of near-duplicate resumes once; the other copies
+are written as rows with no scores and a duplicate_of path pointing at the
+scored row. The detector keeps a small signature per resume, so with --dedup
+memory grows with the archive (a few KB per file) instead of staying flat.
+Clusters are not carried across a --resume: copies of resumes screened before
+the interruption are scored again as new candidates.
+
+A directory can also be ingested once into the persistent candidate index and
+then queried with any number of job descriptions without re-reading files:
+
+    python cli.py index RESUME_DIR [--index candidates.sqlite3]
+    python cli.py query --jd job.txt [--index candidates.sqlite3] [--top 20]
+"""
+import os
+import sys
+import csv
+import json
+import heapq
+import argparse
+import itertools
+from core.parser import iter_resume_files, iter_extract_texts, EXTRACTION_MODES
+from core.document import parse_document
+from core.vectorizer import VECTORIZER_MODES, DEFAULT_VECTORIZER_PATH, CorpusVectorizer, get_vectorizer
+from core.pipeline import iter_rank_candidates
+from core.dedup import DuplicateDetector
+from core.profiling import PROFILER
+
+CSV_FIELDS = [
+    "path", "score", "similarity", "experience_score", "education_score",
+    "experience", "level", "skills", "missing_skills", "summary", "duplicate_of", "error"
+]
+
+def to_row(path, result):
+    """Flat output record for one screened file."""
+    if result is None:
+        return {"path": path, "score": None, "error": "unparseable"}
+    if "duplicate_of" in result:
+        return {"path": path, "score": None, "duplicate_of": result["duplicate_of_file"], "error": None}
+    comps = result["components"]
+    return {
+        "path": path,
+        "score": result["score"],
+        "similarity": round(comps["similarity"], 4),
+        "experience_score": round(comps["experience"], 4),
+        "education_score": comps["education"],
+        "experience": result["experience_match"],
+        "level": result["seniority_level"],
+        "skills": sorted(result["skills"]),
+        "missing_skills": sorted(result["missing_skills"]),
+        "summary": result["summary"],
+        "duplicate_of": None,
+        "error": None
+    }
+
+class ResultWriter:
+    """Appends rows to a JSONL or CSV file, flushing after every row."""
+
+    def __init__(self, path):
+        self.path = path
+        self.is_csv = path.lower().endswith(".csv")
+        new_file = not os.path.exists(path) or os.path.getsize(path) == 0
+        self._file = open(path, "a", encoding="utf-8", newline="")
+        if self.is_csv:
+            self._writer = csv.DictWriter(self._file, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            if new_file:
+                self._writer.writeheader()
+
+    def write(self, row):
+        if self.is_csv:
+            self._writer.writerow({
+                **row,
+                "skills": "; ".join(row.get("skills") or []),
+                "missing_skills": "; ".join(row.get("missing_skills") or [])
+            })
+        else:
+            self._file.write(json.dumps(row) + "\n")
+        self._file.flush()
+
+    def close(self):
+        self._file.close()
+
+def trim_partial_line(path):
+    """Cuts a checkpoint back to its last complete line, dropping a row a killed run left half-written."""
+    if not os.path.exists(path):
+        return
+    with open(path, "rb+") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        while pos > 0:
+            start = max(0, pos - 65536)
+            f.seek(start)
+            newline = f.read(pos - start).rfind(b"\n")
+            if newline >= 0:
+                pos = start + newline + 1
+                break
+            pos = start
+        if pos < end:
+            f.truncate(pos)
+
+def read_rows(path):
+    """Streams rows back out of an existing output file (the resume checkpoint)."""
+    if not os.path.exists(path):
+        return
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.lower().endswith(".csv"):
+            for row in csv.DictReader(f):
+                row["score"] = float(row["score"]) if row["score"] else None
+                yield row
+        else:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+
+def push_top(heap, top, counter, row):
+    """Keeps the best `top` rows in a min-heap; ties keep the earliest row and duplicates are left out."""
+    if top <= 0 or row.get("score") is None or row.get("duplicate_of"):
+        return
+    item = (row["score"], -next(counter), row)
+    if len(heap) < top:
+        heapq.heappush(heap, item)
+    elif item > heap[0]:
+        heapq.heapreplace(heap, item)
+
+# Leading words that select an index command instead of a screening run
+INDEX_COMMANDS = ("index", "query")
+INDEX_BATCH = 200
+
+def index_main(argv):
+    """`cli.py index` ingests a directory into the candidate index; `cli.py query` scores a JD against it."""
+    from core.index import CandidateIndex, DEFAULT_INDEX_PATH
+
+    parser = argparse.ArgumentParser(prog="cli.py", description="Ingest resumes into, or query, the persistent candidate index.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    ingest = commands.add_parser("index", help="parse RESUME_DIR once and store every resume in the index")
+    ingest.add_argument("resume_dir", help="directory searched recursively for .pdf/.docx resumes")
+    ingest.add_argument("--workers", type=int, default=None, help="parsing processes (default: CPU count)")
+    ingest.add_argument("--mode", choices=EXTRACTION_MODES, default="accurate", help="text extraction mode")
+    ingest.add_argument("--timeout", type=float, default=30, help="per-file parsing timeout in seconds")
+    ingest.add_argument("--cache", nargs="?", const="", default=None, metavar="PATH",
+                        help="reuse extracted text from an on-disk cache (default location if PATH is omitted)")
+    query = commands.add_parser("query", help="score a job description against every indexed resume")
+    query.add_argument("--jd", required=True, help="text file with the job description")
+    query.add_argument("--weights", type=float, nargs=3, default=(50, 30, 20), metavar=("SKILLS", "EXPERIENCE", "EDUCATION"))
+    query.add_argument("--top", type=int, default=10, help="how many candidates to report")
+    query.add_argument("--output", "-o", help="write the results here as JSON instead of stdout")
+    for command in (ingest, query):
+        command.add_argument("--index", default=DEFAULT_INDEX_PATH, help="candidate index location")
+    args = parser.parse_args(argv)
+
+    index = CandidateIndex(args.index)
+    try:
+        if args.command == "index":
+            cache = None
+            if args.cache is not None:
+                from core.cache import ExtractionCache, DEFAULT_CACHE_PATH
+                cache = ExtractionCache(path=args.cache or DEFAULT_CACHE_PATH)
+            texts = iter_extract_texts(
+                iter_resume_files(args.resume_dir), max_workers=args.workers, timeout=args.timeout, cache=cache, mode=args.mode
+            )
+            batch, ingested, failed = [], 0, 0
+            for _, path, text in texts:
+                if not text:
+                    failed += 1
+                    continue
+                # Re-ingesting a file replaces its entry, so the path is the candidate ID
+                batch.append((path, text, os.path.basename(path)))
+                if len(batch) == INDEX_BATCH:
+                    index.add_many(batch)
+                    ingested += len(batch)
+                    batch = []
+                    print(f"Indexed {ingested} files ({failed} failed)...", file=sys.stderr)
+            index.add_many(batch)
+            ingested += len(batch)
+            print(f"Indexed {ingested} files ({failed} failed); {len(index)} candidates in {args.index}.", file=sys.stderr)
+            return 0
+
+        with open(args.jd, encoding="utf-8") as f:
+            job_desc = f.read()
+        results = index.query(job_desc, weights=tuple(args.weights), top_k=args.top)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump([dict(to_row(r["id"], r), name=r["name"]) for r in results], f, indent=2)
+        else:
+            for rank, result in enumerate(results, 1):
+                print(f"{rank:>4}. {result['score']:>5}  {result['id']}")
+        return 0
+    finally:
+        index.close()
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv and argv[0] in INDEX_COMMANDS:
+        return index_main(argv)
+
+    parser = argparse.ArgumentParser(
+        description="Screen a directory of resumes against a job description.",
+        epilog="Persistent index: `cli.py index RESUME_DIR` ingests a directory once, `cli.py query --jd FILE` scores against it."
+    )
+    parser.add_argument("resume_dir", help="directory searched recursively for .pdf/.docx resumes")
+    parser.add_argument("--jd", required=True, help="text file with the job description")
+    parser.add_argument("--output", "-o", required=True, help="results file, .jsonl or .csv")
+    parser.add_argument("--weights", type=float, nargs=3, default=(50, 30, 20), metavar=("SKILLS", "EXPERIENCE", "EDUCATION"))
+    parser.add_argument("--workers", type=int, default=None, help="parsing processes (default: CPU count)")
+    parser.add_argument("--mode", choices=EXTRACTION_MODES, default="accurate", help="text extraction mode")
+    parser.add_argument("--vectorizer", choices=VECTORIZER_MODES, default="pairwise", help="how resume/JD term vectors are weighted")
+    parser.add_argument("--vectorizer-path", default=DEFAULT_VECTORIZER_PATH, help="fitted model location for --vectorizer corpus")
+    parser.add_argument("--refit", action="store_true", help="refit the corpus vectorizer on RESUME_DIR even if a saved model exists")
+    parser.add_argument("--dedup", nargs="?", type=float, const=0.8, default=None, metavar="THRESHOLD",
+                        help="score near-duplicate resumes once (MinHash Jaccard threshold, default 0.8)")
+    parser.add_argument("--timeout", type=float, default=30, help="per-file parsing timeout in seconds")
+    parser.add_argument("--top", type=int, default=0, help="also report the best N candidates")
+    parser.add_argument("--top-output", help="write the --top candidates here as JSON instead of stdout")
+    parser.add_argument("--resume", action="store_true", help="skip files already present in --output")
+    parser.add_argument("--profile", metavar="PATH", help="write per-stage timings here (.prom for Prometheus text, else JSON)")
+    parser.add_argument("--cache", nargs="?", const="", default=None, metavar="PATH",
+                        help="reuse extracted text from an on-disk cache (default location if PATH is omitted)")
+    args = parser.parse_args(argv)
+
+    with open(args.jd, encoding="utf-8") as f:
+        job_desc = f.read()
+
+    cache = None
+    if args.cache is not None:
+        from core.cache import ExtractionCache, DEFAULT_CACHE_PATH
+        cache = ExtractionCache(path=args.cache or DEFAULT_CACHE_PATH)
+
+    if args.profile:
+        PROFILER.enable()
+
+    vectorizer = get_vectorizer(args.vectorizer, args.vectorizer_path)
+    if args.vectorizer == "corpus" and (args.refit or not vectorizer.fitted):
+        # A separate streaming pass, so scoring below never has to hold the pool
+        print(f"Fitting corpus vectorizer on {args.resume_dir}...", file=sys.stderr)
+        texts = iter_extract_texts(
+            iter_resume_files(args.resume_dir), max_workers=args.workers, timeout=args.timeout, cache=cache, mode=args.mode
+        )
+        vectorizer = CorpusVectorizer(args.vectorizer_path).fit(parse_document(text) for _, _, text in texts if text)
+        vectorizer.save()
+        print(f"Saved vectorizer ({vectorizer.vocabulary_size} terms, {vectorizer.documents} documents) to {args.vectorizer_path}.", file=sys.stderr)
+
+    heap, counter = [], itertools.count()
+    done = set()
+    if args.resume:
+        # New rows are appended, so a half-written last row must go first
+        trim_partial_line(args.output)
+        for row in read_rows(args.output):
+            done.add(row["path"])
+            push_top(heap, args.top, counter, row)
+        print(f"Resuming: {len(done)} files already screened.", file=sys.stderr)
+        if args.dedup is not None and done:
+            print("Note: near-duplicates of files screened before the interruption are not detected.", file=sys.stderr)
+    elif os.path.exists(args.output) and os.path.getsize(args.output) > 0:
+        parser.error(f"{args.output} already exists; pass --resume to continue it or choose another file")
+
+    files = (f for f in iter_resume_files(args.resume_dir) if f.name not in done)
+    writer = ResultWriter(args.output)
+    screened = failed = duplicates = 0
+    try:
+        stream = iter_rank_candidates(
+            files, job_desc, weights=tuple(args.weights),
+            max_workers=args.workers, timeout=args.timeout, cache=cache, mode=args.mode, vectorizer=vectorizer,
+            dedup=DuplicateDetector(threshold=args.dedup) if args.dedup is not None else None
+        )
+        for _, path, result in stream:
+            row = to_row(path, result)
+            writer.write(row)
+            push_top(heap, args.top, counter, row)
+            screened += 1
+            failed += result is None
+            duplicates += bool(row.get("duplicate_of"))
+            if screened % 100 == 0:
+                print(f"Screened {screened} files ({failed} failed)...", file=sys.stderr)
+    except KeyboardInterrupt:
+        print("Interrupted; rerun with --resume to continue.", file=sys.stderr)
+    finally:
+        writer.close()
+
+    print(f"Screened {screened} files ({failed} failed, {duplicates} near-duplicates). Results in {args.output}.", file=sys.stderr)
+
+    if args.profile:
+        with open(args.profile, "w", encoding="utf-8") as f:
+            f.write(PROFILER.to_prometheus() if args.profile.endswith(".prom") else PROFILER.to_json())
+
+    if args.top:
+        best = [row for _, _, row in sorted(heap, reverse=True)]
+        if args.top_output:
+            with open(args.top_output, "w", encoding="utf-8") as f:
+                json.dump(best, f, indent=2)
+        else:
+            for rank, row in enumerate(best, 1):
+                print(f"{rank:>4}. {row['score']:>5}  {row['path']}")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,71 +1,382 @@
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
-from core.utils import clean_text
+from sklearn.feature_extraction.text import CountVectorizer
+from scipy.sparse import csr_matrix, vstack
+from core.skills import get_default_matcher
+from core.document import ParsedDocument, as_document
+from core.profiling import PROFILER, timed
+from collections import Counter
+from itertools import islice
+import numpy as np
 import re
 
-def rank_candidates(resume_text, job_desc, weights=(50, 30, 20)):
+# Term analyzer for plain cleaned text; ParsedDocument.terms reproduces it
+TERM_OPTIONS = dict(stop_words='english', ngram_range=(1, 2))
+_term_analyzer = CountVectorizer(**TERM_OPTIONS).build_analyzer()
+
+# Flat education component until education parsing exists
+EDUCATION_SCORE = 0.8
+
+# Smoothed IDF of a term present in only one of the two documents a pairwise
+# TfidfVectorizer is fitted on: ln((1 + 2) / (1 + 1)) + 1
+PAIR_IDF = np.log(1.5) + 1.0
+
+def rank_candidates(resume_text, job_desc, weights=(50, 30, 20), vectorizer=None):
     """
     Enhanced ranking engine with weighted scoring and gap analysis.
     weights: (Skills Weight, Experience Weight, Education Weight)
+    vectorizer: a fitted core.vectorizer model, or None for pairwise TF-IDF
+    """
+    # Each document is normalized and tokenized once; every stage below reads
+    # from the resulting ParsedDocument
+    return score_resume(prepare_job(job_desc, vectorizer), resume_text, weights)
+
+def rank_candidates_batch(resumes, job_desc, weights=(50, 30, 20), vectorizer=None):
     """
-    clean_resume = clean_text(resume_text)
-    clean_jd = clean_text(job_desc)
+    Scores a whole resume pool against one job description in a single pass.
+    The JD is cleaned and analysed once, every resume goes into one sparse
+    term-count matrix and all cosine similarities come out of one matrix product.
+
+    Scores are identical to calling rank_candidates once per resume: the
+    per-pair IDF of a two-document TfidfVectorizer only ever takes two values
+    (1 for shared terms, PAIR_IDF otherwise), so it is re-applied here with
+    sparse arithmetic instead of fitting a vectorizer per resume.
+
+    With a corpus or hashing vectorizer the pool is transformed in one call
+    instead; an unfitted corpus vectorizer is fitted on the pool first.
+    """
+    if not resumes:
+        return []
+
+    docs = [as_document(r) for r in resumes]
+    if vectorizer is not None and not vectorizer.fitted:
+        vectorizer.fit(docs)
+
+    # Job Description Profile (computed once for the pool)
+    job = prepare_job(job_desc, vectorizer)
 
     # 1. Semantic Similarity (Skills Weight)
-    vectorizer = TfidfVectorizer(stop_words='english', ngram_range=(1, 2))
-    tfidf_matrix = vectorizer.fit_transform([clean_jd, clean_resume])
-    sim_score = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
+    if vectorizer is None:
+        sim_scores = _pairwise_tfidf_similarity(job, docs)
+    else:
+        with PROFILER.stage("similarity_batch"):
+            sim_scores = vectorizer.similarity(job["vector"], docs)
 
-    # 2. Key Term Extraction & Gap Analysis
-    jd_keywords = extract_skills_v2(clean_jd)
-    resume_keywords = extract_skills_v2(clean_resume)
-    
+    return [
+        score_candidate(sim, extract_skills_v2(doc), detect_experience(doc), job["keywords"], job["exp_info"], weights)
+        for sim, doc in zip(sim_scores, docs)
+    ]
+
+def rank_candidates_matrix(resumes, job_descs, weights=(50, 30, 20), vectorizer=None, chunk_size=1024):
+    """
+    Scores a resume pool against several job descriptions at once and returns
+    the full resumes x jobs matrices instead of one result dict per pair.
+    Each resume is analysed once whatever the number of roles: the terms of
+    all JDs share one vocabulary, so a chunk of resumes becomes one sparse
+    count matrix and every similarity comes out of one matrix product against
+    all JDs, while the experience and skill-gap components are computed with
+    broadcasting over years and skill-indicator matrices.
+
+    resumes may be a generator and is consumed in chunks of chunk_size, so
+    only the component matrices, not the parsed pool, stay in memory (an
+    unfitted corpus vectorizer still needs the whole pool to fit first).
+    Column j equals rank_candidates_batch(resumes, job_descs[j]); use
+    matrix_result() for the full result dict of one pair.
+    """
+    if vectorizer is not None and not vectorizer.fitted:
+        resumes = [as_document(r) for r in resumes]
+        if resumes:
+            vectorizer.fit(resumes)
+        else:
+            vectorizer = None
+
+    # Job Description Profiles (computed once for the pool)
+    jobs = [prepare_job(jd, vectorizer) for jd in job_descs]
+    vocab = _job_vocabulary(jobs)
+    skill_codes = {}
+    for job in jobs:
+        for skill in job["keywords"]:
+            skill_codes.setdefault(skill, len(skill_codes))
+    job_skills = _skill_matrix([job["keywords"] for job in jobs], skill_codes)
+    job_vectors = None
+    if vectorizer is not None and jobs:
+        job_vectors = vstack([job["vector"] for job in jobs]).T.tocsr()
+
+    similarity, skills, exp_info = [], [], []
+    resumes = iter(resumes)
+    while True:
+        chunk = [as_document(r) for r in islice(resumes, chunk_size)]
+        # 1. Semantic Similarity (Skills Weight), against every JD at once
+        similarity.append(_similarity_chunk(chunk, jobs, vocab, vectorizer, job_vectors))
+        skills.extend(extract_skills_v2(doc) for doc in chunk)
+        exp_info.extend(detect_experience(doc) for doc in chunk)
+        if len(chunk) < chunk_size:
+            break
+    similarity = np.vstack(similarity)
+
+    # 3. Seniority & Experience Analysis, for every (resume, job) pair
+    years = np.array([info["years"] for info in exp_info], dtype=np.float64)[:, None]
+    jd_years = np.array([job["exp_info"]["years"] for job in jobs], dtype=np.float64)[None, :]
+    experience = np.where(years >= jd_years, 1.0, years / np.maximum(1, jd_years))
+
+    # Skill gap: matched = shared JD skills, missing = the rest of each JD's list
+    matched = (_skill_matrix(skills, skill_codes) @ job_skills.T).toarray().astype(np.int64)
+    missing = np.array([len(job["keywords"]) for job in jobs], dtype=np.int64)[None, :] - matched
+
+    matrix = {
+        "jobs": jobs,
+        "similarity": similarity,
+        "experience": experience,
+        "matched": matched,
+        "missing": missing,
+        "skills": skills,
+        "exp_info": exp_info
+    }
+    matrix["score"] = matrix_scores(matrix, weights)
+    return matrix
+
+def matrix_scores(matrix, weights=(50, 30, 20)):
+    """Resumes x jobs match scores of a rank_candidates_matrix() result for the given weights."""
+    return np.round(combine_scores(matrix["similarity"], matrix["experience"], EDUCATION_SCORE, weights), 1)
+
+def matrix_result(matrix, row, job, weights=(50, 30, 20)):
+    """The rank_candidates result dict of one (resume row, job column) pair of rank_candidates_matrix()."""
+    jd = matrix["jobs"][job]
+    return score_candidate(
+        matrix["similarity"][row, job], matrix["skills"][row], matrix["exp_info"][row], jd["keywords"], jd["exp_info"], weights
+    )
+
+def top_per_job(scores, k=10):
+    """Row indices of the k best resumes for every job column, best first."""
+    k = min(k, scores.shape[0])
+    if k == 0:
+        return np.zeros((scores.shape[1], 0), dtype=np.int64)
+    top = np.sort(np.argpartition(-scores, k - 1, axis=0)[:k], axis=0)
+    order = np.argsort(-np.take_along_axis(scores, top, axis=0), axis=0, kind="stable")
+    return np.take_along_axis(top, order, axis=0).T
+
+def prepare_job(job_desc, vectorizer=None):
+    """
+    Everything about a job description that scoring needs, computed once so
+    it can be reused for any number of resumes. With a vectorizer the JD's
+    term vector is stored too and resumes are scored against it.
+    """
+    doc = as_document(job_desc)
+    return {
+        "clean": doc.text,
+        "terms": doc.terms,
+        "sq_sum": doc.term_sq_sum,
+        "keywords": extract_skills_v2(doc),
+        "exp_info": detect_experience(doc),
+        "vectorizer": vectorizer,
+        "vector": vectorizer.transform([doc]) if vectorizer is not None else None
+    }
+
+def score_resume(job, resume, weights=(50, 30, 20)):
+    """
+    Scores one resume (raw text or ParsedDocument) against a prepare_job()
+    profile. Gives the same result as rank_candidates without re-analysing
+    the job description, which makes it the building block for streaming
+    pipelines. Similarity comes from the profile's vectorizer when it has one.
+    """
+    doc = as_document(resume)
+    if job.get("vectorizer") is not None:
+        with PROFILER.stage("similarity"):
+            sim_score = job["vectorizer"].similarity(job["vector"], [doc])[0]
+        return score_candidate(
+            sim_score, extract_skills_v2(doc), detect_experience(doc), job["keywords"], job["exp_info"], weights
+        )
+
+    jd_terms = job["terms"]
+    with PROFILER.stage("similarity"):
+        dots = pool_sq_on_jd = jd_sq_on_pool = 0.0
+        for term, count in doc.terms.items():
+            jd_count = jd_terms.get(term)
+            if jd_count:
+                dots += jd_count * count
+                pool_sq_on_jd += count * count
+                jd_sq_on_pool += jd_count * jd_count
+
+        sim_score = pair_cosine(
+            dots=[dots],
+            pool_sq_sums=doc.term_sq_sum,
+            pool_sq_on_jd=pool_sq_on_jd,
+            jd_sq_sum=job["sq_sum"],
+            jd_sq_on_pool=jd_sq_on_pool
+        )[0]
+
+    return score_candidate(
+        sim_score, extract_skills_v2(doc), detect_experience(doc), job["keywords"], job["exp_info"], weights
+    )
+
+@timed("similarity_batch")
+def _pairwise_tfidf_similarity(job, docs):
+    """
+    Cosine similarity of the JD against each resume, weighted exactly as a
+    TfidfVectorizer fitted on just [jd, resume] would weight them.
+    """
+    vocab = _job_vocabulary([job])
+    return _pairwise_tfidf_matrix(
+        _term_matrix([doc.terms for doc in docs], vocab), np.array([doc.term_sq_sum for doc in docs]), [job], vocab
+    )[:, 0]
+
+def _similarity_chunk(docs, jobs, vocab, vectorizer, job_vectors):
+    """Resumes x jobs similarity block for rank_candidates_matrix."""
+    if not docs or not jobs:
+        return np.zeros((len(docs), len(jobs)))
+    with PROFILER.stage("similarity_matrix"):
+        if vectorizer is not None:
+            return (vectorizer.transform(docs) @ job_vectors).toarray()
+        return _pairwise_tfidf_matrix(
+            _term_matrix([doc.terms for doc in docs], vocab), np.array([doc.term_sq_sum for doc in docs]), jobs, vocab
+        )
+
+def _skill_matrix(skill_sets, codes):
+    """Sparse documents x skills indicator matrix over the JD skill codes."""
+    rows, cols = [], []
+    for row, skills in enumerate(skill_sets):
+        for skill in skills:
+            col = codes.get(skill)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+    return csr_matrix((np.ones(len(rows)), (rows, cols)), shape=(len(skill_sets), len(codes)))
+
+def _job_vocabulary(jobs):
+    """Column index for every term of any of the JDs."""
+    vocab = {}
+    for job in jobs:
+        for term in job["terms"]:
+            vocab.setdefault(term, len(vocab))
+    return vocab
+
+def _term_matrix(term_counts, vocab):
+    """
+    Sparse documents x vocab matrix of term counts. Only terms some JD
+    contains contribute to a dot product, so everything outside vocab is
+    dropped here and enters through the per-resume square sums instead.
+    """
+    rows, cols, values = [], [], []
+    for row, terms in enumerate(term_counts):
+        for term, count in terms.items():
+            col = vocab.get(term)
+            if col is not None:
+                rows.append(row)
+                cols.append(col)
+                values.append(count)
+    return csr_matrix((np.asarray(values, dtype=np.float64), (rows, cols)), shape=(len(term_counts), len(vocab)))
+
+def _pairwise_tfidf_matrix(shared, pool_sq_sums, jobs, vocab):
+    """Resumes x jobs pairwise TF-IDF cosines from a _term_matrix over the jobs' vocabulary."""
+    jds = _term_matrix([job["terms"] for job in jobs], vocab)
+    jd_sq = jds.multiply(jds)
+
+    return pair_cosine(
+        dots=(shared @ jds.T).toarray(),
+        pool_sq_sums=np.asarray(pool_sq_sums, dtype=np.float64)[:, None],
+        pool_sq_on_jd=(shared.multiply(shared) @ (jds > 0).astype(np.float64).T).toarray(),
+        jd_sq_sum=np.array([job["sq_sum"] for job in jobs])[None, :],
+        jd_sq_on_pool=((shared > 0).astype(np.float64) @ jd_sq.T).toarray()
+    )
+
+def pair_cosine(dots, pool_sq_sums, pool_sq_on_jd, jd_sq_sum, jd_sq_on_pool):
+    """
+    Pairwise TF-IDF cosine from raw term-count statistics, one entry per resume:
+    dots          - sum of jd_count * resume_count over shared terms
+    pool_sq_sums  - sum of resume_count^2 over all resume terms
+    pool_sq_on_jd - sum of resume_count^2 over terms the JD also has
+    jd_sq_sum     - sum of jd_count^2 over all JD terms
+    jd_sq_on_pool - sum of jd_count^2 over terms the resume also has
+    """
+    scale = PAIR_IDF ** 2 - 1.0
+    # Shared terms carry IDF 1 on both sides, so the dot product is raw counts;
+    # terms outside the intersection carry PAIR_IDF on the side they appear on
+    pool_norms = PAIR_IDF ** 2 * pool_sq_sums - scale * pool_sq_on_jd
+    jd_norms = PAIR_IDF ** 2 * jd_sq_sum - scale * jd_sq_on_pool
+
+    dots = np.asarray(dots, dtype=np.float64)
+    denom = np.sqrt(pool_norms * jd_norms)
+    return np.divide(dots, denom, out=np.zeros_like(dots), where=denom > 0)
+
+def combine_scores(similarity, experience, education, weights=(50, 30, 20)):
+    """
+    Folds component scores (each 0-1) into the weighted 0-100 match score.
+    Works element-wise on NumPy arrays, so a whole pool can be re-ranked for
+    new weights without re-analysing a single resume.
+    """
+    w1, w2, w3 = weights
+    # Normalize weights to ensure total score is 0-100
+    total_weight = (w1 + w2 + w3) or 1
+    return (
+        ((similarity * w1) + 
+         (experience * w2) + 
+         (education * w3)) / total_weight
+    ) * 100
+
+@timed("vectorize")
+def term_counts(doc):
+    """Term frequencies of a ParsedDocument, or of cleaned text under the ranking vectorizer's analyzer."""
+    if isinstance(doc, ParsedDocument):
+        return doc.terms
+    return Counter(_term_analyzer(doc))
+
+@timed("scoring")
+def score_candidate(sim_score, resume_keywords, exp_info, jd_keywords, jd_exp_info, weights=(50, 30, 20)):
+    """
+    Combines a similarity score with a resume's skill set and experience
+    profile into the result dict returned by rank_candidates.
+    """
     matched = jd_keywords.intersection(resume_keywords)
     missing = jd_keywords.difference(resume_keywords)
-    
+
     # 3. Seniority & Experience Analysis
-    exp_info = detect_experience(resume_text)
-    jd_exp_info = detect_experience(job_desc)
-    
     # Simple experience score: if candidate years >= JD years
     exp_score = 1.0 if exp_info['years'] >= jd_exp_info['years'] else (exp_info['years'] / max(1, jd_exp_info['years']))
 
     # 4. Final Weighted Calculation
-    w1, w2, w3 = weights
-    # Normalize weights to ensure total score is 0-100
-    total_weight = w1 + w2 + w3
-    final_score = (
-        ((sim_score * w1) + 
-         (exp_score * w2) + 
-         (0.8 * w3)) / total_weight
-    ) * 100
+    final_score = combine_scores(sim_score, exp_score, EDUCATION_SCORE, weights)
 
     return {
-        "score": round(final_score, 1),
+        "score": round(float(final_score), 1),
+        "components": {
+            "similarity": float(sim_score),
+            "experience": float(exp_score),
+            "education": EDUCATION_SCORE
+        },
         "skills": list(matched)[:15],
         "missing_skills": list(missing)[:10],
         "experience_match": f"{exp_info['years']} Years Found",
+        "experience_years": exp_info['years'],
         "seniority_level": exp_info['level'],
         "summary": generate_summary(matched, exp_info['years'], exp_info['level'])
     }
 
-def extract_skills_v2(text):
-    """Simple skill extractor using regex for tech-heavy terms."""
-    common_tech = r'\b(python|java|javascript|react|aws|azure|sql|node|docker|kubernetes|typescript|c\+\+|linux|machine learning|data science|flutter|kotlin|swift|agile|scrum|devops|rest api|mongodb|postgresql|spark|hadoop)\b'
-    matches = re.findall(common_tech, text.lower())
-    return set(matches)
+def extract_skills_v2(text, matcher=None):
+    """
+    Skill extractor backed by the compiled taxonomy matcher.
+    Returns canonical skill IDs, so aliases like "k8s" count as "kubernetes".
+    A ParsedDocument already carries its skill hits from the parsing pass
+    (timed there as "skills"), so only actual matcher runs are timed here.
+    """
+    if isinstance(text, ParsedDocument) and matcher is None:
+        return text.skills
+    matcher = matcher or get_default_matcher()
+    with PROFILER.stage("skills"):
+        return matcher.match(text.raw if isinstance(text, ParsedDocument) else text)
 
+@timed("experience")
 def detect_experience(text):
     """Heuristic to detect years of experience and seniority."""
-    exp_patterns = [
-        r'(\d+)\+?\s*years?',
-        r'(\d+)\+?\s*yrs?'
-    ]
-    years = 0
-    for p in exp_patterns:
-        matches = re.findall(p, text.lower())
-        if matches:
-            years = max([int(m) for m in matches])
+    if isinstance(text, ParsedDocument):
+        years = text.years_of_experience()
+    else:
+        exp_patterns = [
+            r'(\d+)\+?\s*years?',
+            r'(\d+)\+?\s*yrs?'
+        ]
+        years = 0
+        for p in exp_patterns:
+            matches = re.findall(p, text.lower())
+            if matches:
+                years = max([int(m) for m in matches])
     
     level = "Junior"
     if years > 8: level = "Architect/Principal"
@@ -0,0 +1,151 @@
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+from core.parser import PARSER_VERSION
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "cache", "extractions.sqlite3")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+# Hits only bump last_used in memory; the touches are written out in batches
+TOUCH_BATCH = 256
+TOUCH_INTERVAL = 5.0
+
+class ExtractionCache:
+    """
+    Content-addressed, size-bounded LRU store for extracted resume text.
+    Entries are keyed by a hash of the raw file bytes plus the parser version,
+    so re-uploads of the same file skip parsing and a parser upgrade
+    invalidates everything it produced before.
+
+    The store's total size is kept in a meta row maintained by triggers, so
+    put() never scans the table, and eviction walks the last_used index only
+    as far as it needs to.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_bytes=DEFAULT_MAX_BYTES, version=PARSER_VERSION):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.version = version
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        self._touched = {}  # key -> last_used not yet written
+        self._last_flush = time.monotonic()
+
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS extractions (
+                key TEXT PRIMARY KEY,
+                text TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.executescript("""
+            CREATE INDEX IF NOT EXISTS idx_last_used ON extractions (last_used);
+            CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER NOT NULL);
+            INSERT OR IGNORE INTO meta VALUES ('bytes', (SELECT COALESCE(SUM(size), 0) FROM extractions));
+            CREATE TRIGGER IF NOT EXISTS extractions_insert AFTER INSERT ON extractions
+                BEGIN UPDATE meta SET value = value + new.size WHERE name = 'bytes'; END;
+            CREATE TRIGGER IF NOT EXISTS extractions_update AFTER UPDATE OF size ON extractions
+                BEGIN UPDATE meta SET value = value + new.size - old.size WHERE name = 'bytes'; END;
+            CREATE TRIGGER IF NOT EXISTS extractions_delete AFTER DELETE ON extractions
+                BEGIN UPDATE meta SET value = value - old.size WHERE name = 'bytes'; END;
+        """)
+        self._conn.commit()
+
+    def key_for(self, data, variant=""):
+        """Cache key for a file's raw bytes under this parser version (and extraction variant)."""
+        digest = hashlib.sha256(data).hexdigest()
+        if variant:
+            return f"{self.version}-{variant}:{digest}"
+        return f"{self.version}:{digest}"
+
+    def get(self, key):
+        """Returns the cached text for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute("SELECT text FROM extractions WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._touched[key] = time.time()
+            if len(self._touched) >= TOUCH_BATCH or time.monotonic() - self._last_flush > TOUCH_INTERVAL:
+                self._flush_touches()
+                self._conn.commit()
+            return row[0]
+
+    def put(self, key, text):
+        """Stores text under key, evicting least recently used entries past max_bytes."""
+        size = len(text.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            # An upsert rather than INSERT OR REPLACE, so the size triggers see the old row
+            self._conn.execute(
+                "INSERT INTO extractions (key, text, size, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET text = excluded.text, size = excluded.size, last_used = excluded.last_used",
+                (key, text, size, time.time())
+            )
+            self._touched.pop(key, None)
+            self._evict()
+            self._conn.commit()
+
+    def stats(self):
+        """Hit/miss counters for this instance plus the current store footprint."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM extractions").fetchone()[0]
+            total = self._total()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+            "evictions": self.evictions,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes
+        }
+
+    def clear(self):
+        with self._lock:
+            self._touched.clear()
+            self._conn.execute("DELETE FROM extractions")
+            self._conn.commit()
+
+    def close(self):
+        with self._lock:
+            self._flush_touches()
+            self._conn.commit()
+            self._conn.close()
+
+    def _total(self):
+        return self._conn.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0]
+
+    def _flush_touches(self):
+        if self._touched:
+            self._conn.executemany(
+                "UPDATE extractions SET last_used = ? WHERE key = ?", [(t, k) for k, t in self._touched.items()]
+            )
+            self._touched.clear()
+        self._last_flush = time.monotonic()
+
+    def _evict(self):
+        excess = self._total() - self.max_bytes
+        if excess <= 0:
+            return
+        # Recent hits must count before picking the least recently used entries
+        self._flush_touches()
+        stale = []
+        for key, size in self._conn.execute("SELECT key, size FROM extractions ORDER BY last_used ASC"):
+            stale.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        self._conn.executemany("DELETE FROM extractions WHERE key = ?", stale)
+        self.evictions += len(stale)
@@ -0,0 +1,135 @@
+import zlib
+import numpy as np
+from core.utils import clean_text
+from core.document import ParsedDocument
+from core.profiling import timed
+
+# Permutations are multiply-shift hashes: the top 32 bits of (a * x + b) with
+# wrap-around uint64 arithmetic and odd a
+_SHIFT = np.uint64(32)
+_SHINGLE_BASE = np.uint64(1_000_003)
+
+class _TokenHashes(dict):
+    """crc32 of each token, memoized up to `limit` distinct tokens."""
+
+    limit = 1_000_000
+
+    def __missing__(self, token):
+        value = zlib.crc32(token.encode("utf-8"))
+        if len(self) < self.limit:
+            self[token] = value
+        return value
+
+class DuplicateDetector:
+    """
+    Streaming near-duplicate detection with MinHash signatures and LSH banding.
+    Each document's clean text is cut into word shingles and summarised by a
+    num_perm MinHash signature; the signature is split into `bands` bands and
+    documents sharing any band bucket become candidates, so a new document is
+    only compared with the few candidates it collides with, not the whole pool.
+    A candidate counts as a duplicate when the estimated Jaccard similarity of
+    their shingle sets reaches `threshold`.
+
+    Clusters are formed leader-style: the first document of a cluster is its
+    representative, and add() returns that representative for every later copy,
+    so callers score each cluster once.
+    """
+
+    def __init__(self, threshold=0.8, num_perm=128, bands=16, shingle_size=3, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be a multiple of bands")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        rng = np.random.RandomState(seed)
+        self._a = rng.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64) * np.uint64(2) + np.uint64(1)
+        self._b = rng.randint(0, 1 << 62, size=num_perm, dtype=np.int64).astype(np.uint64)
+        self._token_hashes = _TokenHashes()
+        self._buckets = [{} for _ in range(bands)]
+        self._signatures = {}
+        self._exact = {}
+        self._leader = {}
+        self._members = {}
+
+    def __len__(self):
+        return len(self._leader)
+
+    def signature(self, doc):
+        """MinHash signature of a ParsedDocument or raw text."""
+        return self._signature(_tokens(doc))
+
+    def _signature(self, tokens):
+        # Hash each token once, then fold k consecutive token hashes into one
+        # shingle hash with vectorized polynomial rolling instead of joining strings
+        hashes = np.fromiter(map(self._token_hashes.__getitem__, tokens), dtype=np.uint64, count=len(tokens))
+        if not len(hashes):
+            hashes = np.zeros(1, dtype=np.uint64)
+        k = min(self.shingle_size, len(hashes))
+        n = len(hashes) - k + 1
+        shingles = hashes[:n].copy()
+        for i in range(1, k):
+            shingles = shingles * _SHINGLE_BASE + hashes[i:n + i]
+        # One multiply-shift hash per permutation, minimum over the document's shingles
+        return ((np.outer(self._a, shingles) + self._b[:, None]) >> _SHIFT).min(axis=1).astype(np.uint32)
+
+    @timed("dedup")
+    def add(self, key, doc):
+        """
+        Registers a document under key and returns the key of its cluster
+        representative (key itself when the document is new).
+        """
+        tokens = _tokens(doc)
+        if len(tokens) < self.shingle_size:
+            # Too little text to tell people apart (e.g. image-only scans):
+            # never fold it into anything
+            return self._join(key, key)
+
+        text = doc.text if isinstance(doc, ParsedDocument) else " ".join(tokens)
+        digest = zlib.crc32(text.encode("utf-8")), len(text)
+        leader = self._exact.get(digest)
+        if leader is not None:
+            # The exact twin may itself be a copy; always hand back its representative
+            return self._join(key, self._leader[leader])
+
+        signature = self._signature(tokens)
+        bands = [signature[i * self.rows:(i + 1) * self.rows].tobytes() for i in range(self.bands)]
+
+        best, best_similarity = None, self.threshold
+        seen = set()
+        for bucket, band in zip(self._buckets, bands):
+            for other in bucket.get(band, ()):
+                if other in seen:
+                    continue
+                seen.add(other)
+                similarity = float(np.mean(self._signatures[other] == signature))
+                if similarity >= best_similarity:
+                    best, best_similarity = other, similarity
+
+        self._signatures[key] = signature
+        for bucket, band in zip(self._buckets, bands):
+            bucket.setdefault(band, []).append(key)
+        self._exact.setdefault(digest, key)
+        if best is None:
+            return self._join(key, key)
+        return self._join(key, self._leader[best])
+
+    def clusters(self):
+        """Representative -> member keys (representative first), in insertion order."""
+        return {leader: list(members) for leader, members in self._members.items()}
+
+    def _join(self, key, leader):
+        self._leader[key] = leader
+        self._members.setdefault(leader, []).append(key)
+        return leader
+
+def _tokens(doc):
+    return doc.tokens if isinstance(doc, ParsedDocument) else clean_text(doc).split()
+
+def find_duplicates(docs, threshold=0.8, **options):
+    """Groups a list of documents into near-duplicate clusters of indices (first index first)."""
+    detector = DuplicateDetector(threshold=threshold, **options)
+    for i, doc in enumerate(docs):
+        detector.add(i, doc)
+    return list(detector.clusters().values())
@@ -0,0 +1,82 @@
+import re
+import string
+from collections import Counter
+from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+from core.skills import get_default_matcher, tokenize
+from core.profiling import PROFILER, timed
+
+_PUNCT_TABLE = str.maketrans('', '', string.punctuation)
+_SPACE_RE = re.compile(r'\s+')
+_WORD_RE = re.compile(r'\w+')
+# A number followed by an optional "+" and a unit word ("5+ years", "18 months", "40%")
+_QUANTITY_RE = re.compile(r'(\d+)\+?\s*([^\W\d_]+|%)')
+
+class ParsedDocument:
+    """
+    Everything the analyzer needs from one document, produced in a single
+    normalization pass: the text is lowercased once, quantities are read off
+    that copy, punctuation and whitespace are folded into the clean text, and
+    one tokenization feeds both the skill matcher and the TF-IDF terms.
+
+    text       - clean_text() output
+    tokens     - word tokens of text
+    quantities - (value, unit, start, end) spans such as (5, "years", 120, 128)
+    skills     - canonical skill IDs found in text
+    terms      - unigram + bigram counts (English stop words removed), the
+                 same features the TfidfVectorizer used to extract
+    """
+
+    __slots__ = ("raw", "text", "tokens", "quantities", "skills", "terms")
+
+    def __init__(self, raw, text, tokens, quantities, skills, terms):
+        self.raw = raw
+        self.text = text
+        self.tokens = tokens
+        self.quantities = quantities
+        self.skills = skills
+        self.terms = terms
+
+    @property
+    def term_sq_sum(self):
+        return float(sum(v * v for v in self.terms.values()))
+
+    def years_of_experience(self):
+        """
+        Largest "N years" / "N yrs" figure in the document. An "yrs" mention
+        takes precedence over "years", as in the original two-regex scan.
+        """
+        years = [v for v, unit, _, _ in self.quantities if unit.startswith("year")]
+        yrs = [v for v, unit, _, _ in self.quantities if unit.startswith("yr")]
+        if yrs:
+            return max(yrs)
+        return max(years) if years else 0
+
+@timed("normalize")
+def parse_document(raw, matcher=None):
+    """Builds a ParsedDocument from raw extracted text."""
+    raw = raw or ""
+    lower = raw.lower()
+
+    quantities = [(int(m.group(1)), m.group(2), m.start(), m.end()) for m in _QUANTITY_RE.finditer(lower)]
+    text = _SPACE_RE.sub(' ', lower.translate(_PUNCT_TABLE)).strip()
+    tokens = _WORD_RE.findall(text)
+    # Skills are matched before punctuation is stripped, so c++, c#, .net keep their symbols
+    with PROFILER.stage("skills"):
+        skills = (matcher or get_default_matcher()).match_tokens(tokenize(lower))
+
+    return ParsedDocument(raw, text, tokens, quantities, skills, ngram_counts(tokens))
+
+def as_document(doc, matcher=None):
+    """Passes a ParsedDocument through and parses anything else."""
+    return doc if isinstance(doc, ParsedDocument) else parse_document(doc, matcher)
+
+def ngram_counts(tokens):
+    """
+    Unigram and bigram counts over tokens with English stop words removed,
+    matching TfidfVectorizer(stop_words='english', ngram_range=(1, 2)).
+    """
+    # The vectorizer's default token pattern only keeps words of 2+ characters
+    words = [t for t in tokens if len(t) > 1 and t not in ENGLISH_STOP_WORDS]
+    counts = Counter(words)
+    counts.update(f"{a} {b}" for a, b in zip(words, words[1:]))
+    return counts
@@ -0,0 +1,172 @@
+import os
+import json
+import heapq
+import sqlite3
+import threading
+import numpy as np
+from core.document import parse_document
+from core.analyzer import (
+    extract_skills_v2, detect_experience, pair_cosine, score_candidate, prepare_job
+)
+
+DEFAULT_INDEX_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "index", "candidates.sqlite3")
+
+# SQLite caps the number of bound parameters per statement
+_CHUNK = 500
+
+class CandidateIndex:
+    """
+    On-disk talent pool that many job descriptions can be scored against.
+    Each candidate is analysed once at ingest: cleaned text, skill set,
+    experience and term counts are stored, the latter as an inverted index
+    of (term -> candidate, count) postings. A query only reads the postings
+    of the JD's own terms and reproduces rank_candidates scores exactly,
+    without touching the original files.
+    """
+
+    def __init__(self, path=DEFAULT_INDEX_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS candidates (
+                id TEXT PRIMARY KEY,
+                name TEXT,
+                clean_text TEXT NOT NULL,
+                skills TEXT NOT NULL,
+                years INTEGER NOT NULL,
+                level TEXT NOT NULL,
+                sq_norm REAL NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS postings (
+                term TEXT NOT NULL,
+                candidate_id TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                PRIMARY KEY (term, candidate_id)
+            ) WITHOUT ROWID;
+            CREATE INDEX IF NOT EXISTS idx_postings_candidate ON postings (candidate_id);
+        """)
+        self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM candidates").fetchone()[0]
+
+    def __contains__(self, candidate_id):
+        with self._lock:
+            row = self._conn.execute("SELECT 1 FROM candidates WHERE id = ?", (candidate_id,)).fetchone()
+        return row is not None
+
+    def ids(self):
+        with self._lock:
+            return [row[0] for row in self._conn.execute("SELECT id FROM candidates ORDER BY id")]
+
+    def add(self, candidate_id, resume_text, name=None):
+        """Ingests one resume, replacing any existing entry with the same ID."""
+        self.add_many([(candidate_id, resume_text, name)])
+
+    def add_many(self, items):
+        """Ingests (candidate_id, resume_text, name) tuples in one transaction."""
+        rows = [_analyse(candidate_id, resume_text, name) for candidate_id, resume_text, name in items]
+        with self._lock:
+            with self._conn:
+                for candidate, postings in rows:
+                    self._delete(candidate[0])
+                    self._conn.execute("INSERT INTO candidates VALUES (?, ?, ?, ?, ?, ?, ?)", candidate)
+                    self._conn.executemany("INSERT INTO postings VALUES (?, ?, ?)", postings)
+
+    def remove(self, candidate_id):
+        """Drops a candidate and its postings; returns False if it was not indexed."""
+        with self._lock:
+            with self._conn:
+                return self._delete(candidate_id)
+
+    def get(self, candidate_id):
+        """Stored profile of one candidate, or None."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, name, clean_text, skills, years, level FROM candidates WHERE id = ?", (candidate_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            "id": row[0], "name": row[1], "clean_text": row[2],
+            "skills": json.loads(row[3]), "years": row[4], "level": row[5]
+        }
+
+    def query(self, job_desc, weights=(50, 30, 20), top_k=10):
+        """
+        Scores every indexed candidate against job_desc and returns the top_k
+        rank_candidates-style result dicts, best first, each with "id" and "name".
+        """
+        job = prepare_job(job_desc)
+        jd_terms = job["terms"]
+
+        with self._lock:
+            candidates = self._conn.execute("SELECT id, name, skills, years, level, sq_norm FROM candidates").fetchall()
+            postings = []
+            terms = list(jd_terms)
+            for start in range(0, len(terms), _CHUNK):
+                chunk = terms[start:start + _CHUNK]
+                postings.extend(self._conn.execute(
+                    f"SELECT term, candidate_id, count FROM postings WHERE term IN ({','.join('?' * len(chunk))})", chunk
+                ))
+        if not candidates:
+            return []
+
+        # 1. Similarity statistics from the JD's postings only
+        row_of = {c[0]: i for i, c in enumerate(candidates)}
+        dots = np.zeros(len(candidates))
+        pool_sq_on_jd = np.zeros(len(candidates))
+        jd_sq_on_pool = np.zeros(len(candidates))
+        for term, candidate_id, count in postings:
+            i = row_of[candidate_id]
+            jd_count = jd_terms[term]
+            dots[i] += jd_count * count
+            pool_sq_on_jd[i] += count * count
+            jd_sq_on_pool[i] += jd_count * jd_count
+
+        sims = pair_cosine(
+            dots=dots,
+            pool_sq_sums=np.array([c[5] for c in candidates]),
+            pool_sq_on_jd=pool_sq_on_jd,
+            jd_sq_sum=job["sq_sum"],
+            jd_sq_on_pool=jd_sq_on_pool
+        )
+
+        # 2. Shared scoring logic, then keep the best top_k
+        results = []
+        for (candidate_id, name, skills, years, level, _), sim in zip(candidates, sims):
+            result = score_candidate(
+                sim, set(json.loads(skills)), {"years": years, "level": level}, job["keywords"], job["exp_info"], weights
+            )
+            result["id"] = candidate_id
+            result["name"] = name
+            results.append(result)
+        return heapq.nlargest(top_k, results, key=lambda r: r["score"])
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def _delete(self, candidate_id):
+        self._conn.execute("DELETE FROM postings WHERE candidate_id = ?", (candidate_id,))
+        return self._conn.execute("DELETE FROM candidates WHERE id = ?", (candidate_id,)).rowcount > 0
+
+def _analyse(candidate_id, resume_text, name):
+    """Candidate row and postings rows for one resume."""
+    doc = parse_document(resume_text)
+    exp_info = detect_experience(doc)
+    candidate = (
+        candidate_id,
+        name,
+        doc.text,
+        json.dumps(sorted(extract_skills_v2(doc))),
+        exp_info["years"],
+        exp_info["level"],
+        doc.term_sq_sum
+    )
+    postings = [(term, candidate_id, count) for term, count in doc.terms.items()]
+    return candidate, postings
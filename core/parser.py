@@ -1,38 +1,318 @@
 import io
+import os
+import time
+import queue
+import multiprocessing
+from collections import deque
+import zipfile
+from xml.etree import ElementTree
 from pdfminer.high_level import extract_text as extract_pdf_text
+from pdfminer.pdfinterp import PDFResourceManager, PDFPageInterpreter
+from pdfminer.pdfdevice import PDFTextDevice
+from pdfminer.pdffont import PDFUnicodeNotDefined
+from pdfminer.pdfpage import PDFPage
 import docx
+from core.profiling import PROFILER
 
-def extract_text(file_uploaded):
+# Bump whenever extraction output changes so cached text is not reused
+PARSER_VERSION = "1"
+
+# "accurate" keeps full pdfminer layout analysis and the python-docx object
+# model; "fast" skips layout analysis, streams DOCX XML and caps the input
+EXTRACTION_MODES = ("accurate", "fast")
+
+# Fast-mode budgets: resumes rarely need more than the first few pages
+FAST_MAX_PAGES = 5
+FAST_MAX_CHARS = 50000
+
+# Seconds a single file may spend in a worker before it is abandoned
+PARSE_TIMEOUT = 30
+
+# File types the extractors understand
+SUPPORTED_TYPES = ('pdf', 'docx')
+
+class LocalFile:
+    """
+    Path-backed stand-in for an uploaded file (a .name and a .read()), so
+    files on disk can go through the same extractors. Bytes are only read
+    when read() is called.
+    """
+
+    def __init__(self, path):
+        self.name = path
+
+    def read(self):
+        with open(self.name, 'rb') as f:
+            return f.read()
+
+def iter_resume_files(root):
+    """Lazily walks a directory tree, yielding a LocalFile per supported resume."""
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if _file_type(filename) in SUPPORTED_TYPES:
+                yield LocalFile(os.path.join(dirpath, filename))
+
+def extract_text(file_uploaded, cache=None, mode="accurate"):
     """
     Routes the file to the correct extractor based on file extension.
+    With an ExtractionCache, previously seen file contents skip parsing entirely.
+    mode is "accurate" (full layout analysis) or "fast" (see EXTRACTION_MODES).
     """
-    file_type = file_uploaded.name.split('.')[-1].lower()
+    if cache is not None:
+        data = file_uploaded.read()
+        key = _cache_key(cache, data, mode)
+        text = cache.get(key)
+        if text is None:
+            PROFILER.count("cache_misses")
+            with PROFILER.stage("parse", doc=file_uploaded.name, nbytes=len(data)):
+                text = extract_text_from_bytes(file_uploaded.name, data, mode)
+            if text:
+                cache.put(key, text)
+        else:
+            PROFILER.count("cache_hits")
+        return text
+
+    file_type = _file_type(file_uploaded.name)
     
     try:
-        if file_type == 'pdf':
-            return extract_text_from_pdf(file_uploaded)
-        elif file_type == 'docx':
-            return extract_text_from_docx(file_uploaded)
+        with PROFILER.stage("parse", doc=file_uploaded.name):
+            if file_type == 'pdf':
+                return extract_text_from_pdf(file_uploaded, mode)
+            elif file_type == 'docx':
+                return extract_text_from_docx(file_uploaded, mode)
     except Exception as e:
         print(f"Error parsing {file_uploaded.name}: {e}")
         return None
 
-def extract_text_from_pdf(file):
+def extract_text_from_pdf(file, mode="accurate", max_pages=FAST_MAX_PAGES, max_chars=FAST_MAX_CHARS):
     """
     Extracts text from a PDF file using pdfminer.
+    "accurate" runs full layout analysis on every page; "fast" writes
+    characters in content-stream order and stops after max_pages pages or
+    max_chars characters.
     """
-    # Create a BytesIO object from the uploaded file
-    file_bytes = io.BytesIO(file.read())
-    text = extract_pdf_text(file_bytes)
+    stream = _as_stream(file)
+    if mode == "fast":
+        return _extract_pdf_fast(stream, max_pages, max_chars)
+    text = extract_pdf_text(stream)
     return text
 
-def extract_text_from_docx(file):
+def extract_text_from_docx(file, mode="accurate", max_chars=FAST_MAX_CHARS):
     """
-    Extracts text from a DOCX file using python-docx.
+    Extracts text from a DOCX file.
+    "accurate" builds the python-docx object model; "fast" streams
+    word/document.xml out of the zip with an incremental XML parser and
+    stops after max_chars characters.
     """
-    file_bytes = io.BytesIO(file.read())
-    doc = docx.Document(file_bytes)
+    stream = _as_stream(file)
+    if mode == "fast":
+        return _extract_docx_fast(stream, max_chars)
+    doc = docx.Document(stream)
     full_text = []
     for para in doc.paragraphs:
         full_text.append(para.text)
-    return "\n".join(full_text)
\ No newline at end of file
+    return "\n".join(full_text)
+
+def extract_text_from_bytes(file_name, data, mode="accurate"):
+    """
+    Routes raw file bytes to the correct extractor based on the file name.
+    """
+    file_type = _file_type(file_name)
+
+    try:
+        if file_type == 'pdf':
+            return extract_text_from_pdf(io.BytesIO(data), mode)
+        elif file_type == 'docx':
+            return extract_text_from_docx(io.BytesIO(data), mode)
+    except Exception as e:
+        print(f"Error parsing {file_name}: {e}")
+        return None
+
+def iter_extract_texts(files, max_workers=None, timeout=PARSE_TIMEOUT, cache=None, mode="accurate"):
+    """
+    Yields (index, file_name, text) for each file as soon as it is extracted,
+    in completion order. files may be any iterable and is consumed lazily:
+    only as many files as there are workers are read and in flight at once,
+    so memory stays bounded however long the input is.
+    """
+    workers = max(1, max_workers or os.cpu_count() or 1)
+    if hasattr(files, '__len__'):
+        workers = max(1, min(workers, len(files)))
+
+    source = enumerate(files)
+    exhausted = False
+    jobs = {}  # job index -> (file name, raw bytes), held until the job finishes
+    keys = {}
+    requeued = deque()
+    in_flight = {}  # job index -> deadline
+    finished = queue.Queue()
+    pool = None
+
+    try:
+        while True:
+            # Only hand out as many jobs as there are workers, so a job's
+            # deadline starts roughly when a worker actually picks it up
+            while len(in_flight) < workers:
+                if requeued:
+                    idx = requeued.popleft()
+                elif not exhausted:
+                    item = next(source, None)
+                    if item is None:
+                        exhausted = True
+                        continue
+                    idx, file = item
+                    data = file.read()
+                    if cache is not None:
+                        key = _cache_key(cache, data, mode)
+                        text = cache.get(key)
+                        if text is not None:
+                            PROFILER.count("cache_hits")
+                            yield idx, file.name, text
+                            continue
+                        PROFILER.count("cache_misses")
+                        keys[idx] = key
+                    jobs[idx] = (file.name, data)
+                else:
+                    break
+
+                if pool is None:
+                    pool = multiprocessing.Pool(workers)
+                in_flight[idx] = time.monotonic() + timeout
+                pool.apply_async(
+                    _extract_job, (idx,) + jobs[idx] + (mode,),
+                    callback=finished.put,
+                    error_callback=lambda exc, idx=idx: finished.put((idx, None, 0.0))
+                )
+
+            if not in_flight:
+                break
+
+            wait = max(0, min(in_flight.values()) - time.monotonic())
+            try:
+                idx, text, seconds = finished.get(timeout=wait)
+            except queue.Empty:
+                now = time.monotonic()
+                for idx in [i for i, deadline in in_flight.items() if deadline <= now]:
+                    file_name, _ = jobs.pop(idx)
+                    keys.pop(idx, None)
+                    del in_flight[idx]
+                    print(f"Error parsing {file_name}: timed out after {timeout}s")
+                    PROFILER.count("parse_timeouts")
+                    yield idx, file_name, None
+
+                # A hung worker cannot be reclaimed, so replace the pool and
+                # requeue the jobs that were still running on it
+                pool.terminate()
+                requeued.extendleft(sorted(in_flight, reverse=True))
+                in_flight.clear()
+                pool = multiprocessing.Pool(workers)
+                continue
+
+            if idx not in in_flight:
+                # Late result for a job that already timed out or was requeued
+                continue
+            del in_flight[idx]
+            file_name, data = jobs.pop(idx)
+            PROFILER.record("parse", seconds, doc=file_name, nbytes=len(data))
+            if not text:
+                PROFILER.count("parse_failures")
+            key = keys.pop(idx, None)
+            if key is not None and text:
+                cache.put(key, text)
+            yield idx, file_name, text
+    finally:
+        if pool is not None:
+            pool.terminate()
+
+def _extract_job(idx, file_name, data, mode):
+    """Process pool entry point; returns the job index, its text and the parse time."""
+    start = time.perf_counter()
+    text = extract_text_from_bytes(file_name, data, mode)
+    return idx, text, time.perf_counter() - start
+
+def _file_type(file_name):
+    return file_name.split('.')[-1].lower()
+
+def _as_stream(file):
+    """Seekable binary stream over file without copying it when it already is one."""
+    if hasattr(file, 'seekable') and file.seekable():
+        return file
+    return io.BytesIO(file.read())
+
+def _cache_key(cache, data, mode):
+    # Fast and accurate output differ, so they are cached separately
+    return cache.key_for(data) if mode == "accurate" else cache.key_for(data, variant=mode)
+
+class _StreamTextDevice(PDFTextDevice):
+    """
+    pdfminer device that writes characters in content-stream order with no
+    layout analysis, inserting a newline when the baseline moves and a space
+    when there is a visible gap between characters.
+    """
+
+    def __init__(self, rsrcmgr):
+        super().__init__(rsrcmgr)
+        self.parts = []
+        self.size = 0
+        self.last = None  # (x where the previous char ended, baseline y, font height)
+
+    def render_char(self, matrix, font, fontsize, scaling, rise, cid, ncs, graphicstate):
+        try:
+            text = font.to_unichr(cid)
+        except PDFUnicodeNotDefined:
+            text = ""
+        adv = font.char_width(cid) * fontsize * scaling
+        a, _, _, d, x, y = matrix
+        height = abs(d) * fontsize or fontsize
+
+        if self.last is not None:
+            last_x, last_y, last_height = self.last
+            if abs(y - last_y) > last_height * 0.5:
+                self.parts.append("\n")
+            elif x - last_x > last_height * 0.2:
+                self.parts.append(" ")
+        self.last = (x + adv * a, y, height)
+
+        self.parts.append(text)
+        self.size += len(text)
+        return adv
+
+def _extract_pdf_fast(stream, max_pages, max_chars):
+    rsrcmgr = PDFResourceManager()
+    device = _StreamTextDevice(rsrcmgr)
+    interpreter = PDFPageInterpreter(rsrcmgr, device)
+    for page in PDFPage.get_pages(stream, maxpages=max_pages or 0):
+        interpreter.process_page(page)
+        device.parts.append("\n\n")
+        device.last = None
+        if max_chars and device.size >= max_chars:
+            break
+    device.close()
+    text = "".join(device.parts)
+    return text[:max_chars] if max_chars else text
+
+_W = "{http://schemas.openxmlformats.org/wordprocessingml/2006/main}"
+
+def _extract_docx_fast(stream, max_chars):
+    parts = []
+    size = 0
+    with zipfile.ZipFile(stream) as archive, archive.open("word/document.xml") as xml:
+        for _, elem in ElementTree.iterparse(xml, events=("end",)):
+            tag = elem.tag
+            if tag == _W + "t":
+                if elem.text:
+                    parts.append(elem.text)
+                    size += len(elem.text)
+            elif tag == _W + "tab":
+                parts.append("\t")
+            elif tag in (_W + "br", _W + "cr"):
+                parts.append("\n")
+            elif tag == _W + "p":
+                parts.append("\n")
+                # Drop finished paragraphs so memory stays flat on huge documents
+                elem.clear()
+                if max_chars and size >= max_chars:
+                    break
+    text = "".join(parts).rstrip("\n")
+    return text[:max_chars] if max_chars else text
@@ -0,0 +1,91 @@
+from core.parser import iter_extract_texts, PARSE_TIMEOUT
+from core.analyzer import prepare_job, score_resume, rank_candidates_matrix
+from core.document import parse_document, as_document
+from core.profiling import PROFILER
+
+def iter_rank_candidates(files, job_desc, weights=(50, 30, 20), max_workers=None, timeout=PARSE_TIMEOUT, cache=None, mode="accurate",
+                         vectorizer=None, dedup=None):
+    """
+    Streaming parse -> score pipeline.
+    Yields (index, file_name, result) as soon as each resume is scored, in
+    completion order; result is None when the file could not be parsed.
+    The job description is analysed once up front, and files are read and
+    parsed with at most max_workers in flight, so a slow consumer never
+    causes unbounded buffering.
+
+    An unfitted corpus vectorizer has to see the whole pool before anything
+    can be scored, so in that case every file is parsed first, the vectorizer
+    is fitted on the parsed pool, and only then are results yielded.
+
+    With a DuplicateDetector as dedup, only the first resume of each
+    near-duplicate cluster is scored; later copies are yielded as a
+    reference {"duplicate_of": its index, "duplicate_of_file": its name}
+    instead of a result, so only leader file names are kept, not results.
+    The detector itself still keeps a signature per document, so memory
+    grows with the pool when dedup is on.
+    """
+    stream = iter_extract_texts(files, max_workers=max_workers, timeout=timeout, cache=cache, mode=mode)
+    if vectorizer is not None and not vectorizer.fitted:
+        parsed = [(idx, file_name, parse_document(text) if text else None) for idx, file_name, text in stream]
+        docs = [doc for _, _, doc in parsed if doc is not None]
+        if docs:
+            vectorizer.fit(docs)
+        else:
+            # Nothing parsed, so nothing will be scored
+            vectorizer = None
+        stream = parsed
+
+    job = prepare_job(job_desc, vectorizer)
+    leaders = {}
+    for idx, file_name, text in stream:
+        if not text:
+            yield idx, file_name, None
+            continue
+        with PROFILER.document(file_name):
+            doc = as_document(text)
+            leader = dedup.add(idx, doc) if dedup is not None else idx
+            if leader == idx:
+                result = score_resume(job, doc, weights)
+        if leader != idx:
+            # Near-duplicate of a resume already scored: point at its result
+            PROFILER.count("duplicates")
+            yield idx, file_name, {"duplicate_of": leader, "duplicate_of_file": leaders[leader]}
+            continue
+        if dedup is not None:
+            leaders[idx] = file_name
+        yield idx, file_name, result
+
+def rank_files_matrix(files, job_descs, weights=(50, 30, 20), max_workers=None, timeout=PARSE_TIMEOUT, cache=None, mode="accurate",
+                      vectorizer=None, dedup=None, on_progress=None):
+    """
+    Parses a resume pool once and scores it against every job description
+    with rank_candidates_matrix. Matrix row i is candidates[i], an
+    (index, file_name) pair in completion order; files that could not be
+    parsed are left out, and with a DuplicateDetector as dedup only the first
+    resume of each near-duplicate cluster gets a row, with the other copies'
+    file names listed under duplicates[index]. on_progress(done, file_name)
+    is called after each file.
+    """
+    candidates, duplicates = [], {}
+
+    def documents():
+        done = 0
+        for idx, file_name, text in iter_extract_texts(files, max_workers=max_workers, timeout=timeout, cache=cache, mode=mode):
+            done += 1
+            if text:
+                with PROFILER.document(file_name):
+                    doc = parse_document(text)
+                    leader = dedup.add(idx, doc) if dedup is not None else idx
+                if leader == idx:
+                    candidates.append((idx, file_name))
+                    yield doc
+                else:
+                    PROFILER.count("duplicates")
+                    duplicates.setdefault(leader, []).append(file_name)
+            if on_progress is not None:
+                on_progress(done, file_name)
+
+    matrix = rank_candidates_matrix(documents(), job_descs, weights, vectorizer)
+    matrix["candidates"] = candidates
+    matrix["duplicates"] = duplicates
+    return matrix
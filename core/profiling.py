@@ -0,0 +1,199 @@
+import time
+import json
+import heapq
+import functools
+import threading
+import contextvars
+from contextlib import contextmanager
+
+class _NullTimer:
+    """Shared no-op context manager handed out while profiling is disabled."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_TIMER = _NullTimer()
+
+class _StageTimer:
+    def __init__(self, profiler, stage, doc, nbytes):
+        self.profiler = profiler
+        self.stage = stage
+        self.doc = doc
+        self.nbytes = nbytes
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.stage, time.perf_counter() - self.start, doc=self.doc, nbytes=self.nbytes)
+        return False
+
+class Profiler:
+    """
+    Per-stage timing and counters for the screening pipeline.
+    Disabled by default: every hook then reduces to one attribute check (and
+    a shared no-op context manager), so instrumented code pays nothing in
+    normal runs. When enabled it aggregates calls, time and bytes per stage,
+    keeps a per-document breakdown and the slowest documents per stage.
+    """
+
+    def __init__(self, slowest=10, max_documents=10000):
+        self.enabled = False
+        self.slowest = slowest
+        self.max_documents = max_documents
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+
+    def enable(self):
+        self.enabled = True
+
+    def disable(self):
+        self.enabled = False
+
+    def reset(self):
+        with self._lock:
+            self._stages = {}
+            self._counters = {}
+            self._documents = {}
+            self._slow = {}
+
+    def stage(self, name, doc=None, nbytes=0):
+        """Context manager timing one stage; doc defaults to the current document."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _StageTimer(self, name, doc, nbytes)
+
+    @contextmanager
+    def document(self, doc):
+        """Attributes stages timed inside the block to doc (per thread)."""
+        previous = getattr(self._local, "doc", None)
+        self._local.doc = doc
+        try:
+            yield
+        finally:
+            self._local.doc = previous
+
+    def record(self, name, seconds, doc=None, nbytes=0):
+        """Adds one timed call of a stage."""
+        if not self.enabled:
+            return
+        doc = doc if doc is not None else getattr(self._local, "doc", None)
+        with self._lock:
+            agg = self._stages.setdefault(name, {"calls": 0, "seconds": 0.0, "max_seconds": 0.0, "bytes": 0})
+            agg["calls"] += 1
+            agg["seconds"] += seconds
+            agg["bytes"] += nbytes
+            agg["max_seconds"] = max(agg["max_seconds"], seconds)
+            if doc is None:
+                return
+
+            per_doc = self._documents.get(doc)
+            if per_doc is None and len(self._documents) < self.max_documents:
+                per_doc = self._documents[doc] = {}
+            if per_doc is not None:
+                per_doc[name] = per_doc.get(name, 0.0) + seconds
+
+            slow = self._slow.setdefault(name, [])
+            item = (seconds, doc)
+            if len(slow) < self.slowest:
+                heapq.heappush(slow, item)
+            elif item > slow[0]:
+                heapq.heapreplace(slow, item)
+
+    def count(self, name, value=1):
+        """Bumps a plain counter (cache hits, failures, ...)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def snapshot(self):
+        """Plain-dict view of everything recorded so far."""
+        with self._lock:
+            stages = {
+                name: {
+                    "calls": agg["calls"],
+                    "seconds": round(agg["seconds"], 6),
+                    "mean_ms": round(agg["seconds"] / agg["calls"] * 1000, 3) if agg["calls"] else 0.0,
+                    "max_ms": round(agg["max_seconds"] * 1000, 3),
+                    "bytes": agg["bytes"]
+                }
+                for name, agg in self._stages.items()
+            }
+            slowest = {
+                name: [{"document": doc, "ms": round(s * 1000, 3)} for s, doc in sorted(items, reverse=True)]
+                for name, items in self._slow.items()
+            }
+            documents = {doc: {k: round(v, 6) for k, v in times.items()} for doc, times in self._documents.items()}
+            return {
+                "stages": stages,
+                "counters": dict(self._counters),
+                "slowest": slowest,
+                "documents": documents
+            }
+
+    def to_json(self):
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, prefix="talentpulse"):
+        """Prometheus text exposition of the aggregate stage metrics and counters."""
+        snap = self.snapshot()
+        lines = []
+        metrics = [
+            ("stage_calls_total", "counter", "Instrumented calls per pipeline stage.", "calls", 1),
+            ("stage_seconds_total", "counter", "Wall time spent per pipeline stage.", "seconds", 1),
+            ("stage_bytes_total", "counter", "Input bytes processed per pipeline stage.", "bytes", 1),
+            ("stage_max_seconds", "gauge", "Slowest single call per pipeline stage.", "max_ms", 0.001),
+        ]
+        for metric, kind, help_text, key, factor in metrics:
+            lines.append(f"# HELP {prefix}_{metric} {help_text}")
+            lines.append(f"# TYPE {prefix}_{metric} {kind}")
+            for name, agg in sorted(snap["stages"].items()):
+                lines.append(f'{prefix}_{metric}{{stage="{name}"}} {agg[key] * factor:g}')
+        lines.append(f"# HELP {prefix}_events_total Pipeline event counters.")
+        lines.append(f"# TYPE {prefix}_events_total counter")
+        for name, value in sorted(snap["counters"].items()):
+            lines.append(f'{prefix}_events_total{{event="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+class _ActiveProfiler:
+    """Forwards every attribute to the profiler active in the current context."""
+
+    def __getattr__(self, name):
+        return getattr(_active.get(), name)
+
+# The core hooks record into the active profiler: a process-wide default,
+# unless a caller scoped its own with use_profiler() (one per app session,
+# so concurrent sessions never reset or read each other's timings)
+_active = contextvars.ContextVar("profiler", default=Profiler())
+PROFILER = _ActiveProfiler()
+
+@contextmanager
+def use_profiler(profiler):
+    """Makes profiler the one the hooks record into for the rest of the block (this thread/context only)."""
+    token = _active.set(profiler)
+    try:
+        yield profiler
+    finally:
+        _active.reset(token)
+
+def timed(stage):
+    """Decorator timing every call of a function as `stage` when the active profiler is enabled."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            profiler = _active.get()
+            if not profiler.enabled:
+                return fn(*args, **kwargs)
+            start = time.perf_counter()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                profiler.record(stage, time.perf_counter() - start)
+        return wrapper
+    return decorator
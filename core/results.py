@@ -0,0 +1,197 @@
+from array import array
+import numpy as np
+import pandas as pd
+from core.analyzer import combine_scores, generate_summary
+
+ID_PREFIX = "C-"
+ID_OFFSET = 1000
+
+SORT_COLUMNS = ("Score", "Experience", "Name", "ID")
+RECORD_COLUMNS = ("ID", "Name", "RawName", "Score", "Skills", "Missing", "Experience", "Level", "Summary", "Copies", "Duplicates")
+
+class _Interner:
+    """Maps repeated strings (skills, levels) to small integer codes."""
+
+    def __init__(self):
+        self.codes = {}
+        self.values = []
+
+    def code(self, value):
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+class ResultStore:
+    """
+    Compact columnar store for a scored pool.
+    Component scores and years live in typed arrays, seniority levels and
+    skills are interned as integer codes (skill lists as one flat code array
+    plus offsets), and the summary and experience strings are rebuilt on
+    demand instead of being stored per candidate. An ID -> row dict gives
+    direct lookups, and view() sorts and filters with NumPy so only the rows
+    of the visible page are ever turned into a DataFrame.
+    """
+
+    def __init__(self):
+        self.keys = array("i")
+        self.names = []
+        self.similarity = array("d")
+        self.experience = array("d")
+        self.education = array("d")
+        self.years = array("i")
+        self.level_codes = array("B")
+        self.copies = array("i")
+        self.duplicates = {}
+        self.levels = _Interner()
+        self.skills = _Interner()
+        self._matched = array("i")
+        self._matched_offsets = array("q", [0])
+        self._missing = array("i")
+        self._missing_offsets = array("q", [0])
+        self._rows = {}
+
+    def __len__(self):
+        return len(self.keys)
+
+    def add(self, key, name, result):
+        """Appends one rank_candidates-style result; returns its row."""
+        row = len(self.keys)
+        self._rows[key] = row
+        self.keys.append(key)
+        self.names.append(name)
+        comps = result["components"]
+        self.similarity.append(comps["similarity"])
+        self.experience.append(comps["experience"])
+        self.education.append(comps["education"])
+        self.years.append(result["experience_years"])
+        self.level_codes.append(self.levels.code(result["seniority_level"]))
+        self.copies.append(1)
+        self._matched.extend(self.skills.code(s) for s in result["skills"])
+        self._matched_offsets.append(len(self._matched))
+        self._missing.extend(self.skills.code(s) for s in result["missing_skills"])
+        self._missing_offsets.append(len(self._missing))
+        return row
+
+    def add_duplicate(self, leader_key, name):
+        """Folds a near-duplicate submission into its leader's row."""
+        row = self._rows[leader_key]
+        self.copies[row] += 1
+        self.duplicates.setdefault(row, []).append(name)
+
+    # Lookups
+
+    def candidate_id(self, row):
+        return f"{ID_PREFIX}{ID_OFFSET + self.keys[row]}"
+
+    def row_of(self, candidate_id):
+        """Row of a candidate ID such as "C-1042", or None."""
+        try:
+            return self._rows.get(int(candidate_id[len(ID_PREFIX):]) - ID_OFFSET)
+        except (TypeError, ValueError):
+            return None
+
+    def matched_skills(self, row):
+        return [self.skills.values[c] for c in self._matched[self._matched_offsets[row]:self._matched_offsets[row + 1]]]
+
+    def missing_skills(self, row):
+        return [self.skills.values[c] for c in self._missing[self._missing_offsets[row]:self._missing_offsets[row + 1]]]
+
+    def level(self, row):
+        return self.levels.values[self.level_codes[row]]
+
+    def record(self, row, scores=None, blind=False):
+        """Everything about one candidate as a plain dict (the old DataFrame row)."""
+        skills = self.matched_skills(row)
+        years = self.years[row]
+        level = self.level(row)
+        return {
+            "ID": self.candidate_id(row),
+            "Name": "Candidate (Hidden)" if blind else self.names[row],
+            "RawName": self.names[row],
+            "Score": round(float(scores[row]), 1) if scores is not None else None,
+            "Skills": skills,
+            "Missing": self.missing_skills(row),
+            "Experience": f"{years} Years Found",
+            "Level": level,
+            "Summary": generate_summary(skills, years, level),
+            "Copies": self.copies[row],
+            "Duplicates": self.duplicates.get(row, [])
+        }
+
+    # Vectorized views
+
+    def scores(self, weights=(50, 30, 20)):
+        """Weighted match score of every row for the given slider weights."""
+        return np.round(combine_scores(
+            np.frombuffer(self.similarity, dtype=np.float64),
+            np.frombuffer(self.experience, dtype=np.float64),
+            np.frombuffer(self.education, dtype=np.float64),
+            weights
+        ), 1)
+
+    def top(self, scores, k=10):
+        """Rows of the k best scores, best first, without sorting the whole pool."""
+        k = min(k, len(scores))
+        if k == 0:
+            return np.zeros(0, dtype=np.int64)
+        rows = np.sort(np.argpartition(-scores, k - 1)[:k])
+        return rows[np.argsort(-scores[rows], kind="stable")]
+
+    def view(self, scores, sort_by="Score", descending=True, min_score=None, levels=None, skill=None, search=None):
+        """Row order of a filtered, sorted leaderboard."""
+        mask = np.ones(len(self), dtype=bool)
+        if min_score:
+            mask &= scores >= min_score
+        if levels:
+            codes = [self.levels.codes[l] for l in levels if l in self.levels.codes]
+            mask &= np.isin(np.frombuffer(self.level_codes, dtype=np.uint8), codes)
+        if skill:
+            mask &= self._has_skill(skill)
+        if search:
+            mask &= self._matches(search)
+        rows = np.flatnonzero(mask)
+
+        if sort_by == "Name":
+            order = np.argsort(np.array([self.names[r].lower() for r in rows], dtype=object), kind="stable")
+            return rows[order[::-1] if descending else order]
+
+        if sort_by == "Score":
+            key = scores[rows]
+        elif sort_by == "Experience":
+            key = np.frombuffer(self.years, dtype=np.int32)[rows]
+        else:
+            key = np.frombuffer(self.keys, dtype=np.int32)[rows]
+        # Negating instead of reversing keeps ties in row order both ways
+        return rows[np.argsort(-key if descending else key, kind="stable")]
+
+    def frame(self, rows, scores, blind=False):
+        return pd.DataFrame([self.record(r, scores, blind) for r in rows], columns=list(RECORD_COLUMNS))
+
+    def search(self, query, limit=50):
+        """Rows whose ID or file name contains query (case-insensitive)."""
+        return np.flatnonzero(self._matches(query))[:limit]
+
+    def level_counts(self):
+        counts = np.bincount(np.frombuffer(self.level_codes, dtype=np.uint8), minlength=len(self.levels.values))
+        return {level: int(n) for level, n in zip(self.levels.values, counts)}
+
+    def _has_skill(self, skill):
+        code = self.skills.codes.get(skill)
+        if code is None:
+            return np.zeros(len(self), dtype=bool)
+        offsets = np.frombuffer(self._matched_offsets, dtype=np.int64)
+        hits = np.flatnonzero(np.frombuffer(self._matched, dtype=np.int32) == code)
+        mask = np.zeros(len(self), dtype=bool)
+        mask[np.searchsorted(offsets, hits, side="right") - 1] = True
+        return mask
+
+    def _matches(self, query):
+        query = query.strip().lower()
+        if not query:
+            return np.ones(len(self), dtype=bool)
+        return np.fromiter(
+            (query in name.lower() or query in self.candidate_id(r).lower() for r, name in enumerate(self.names)),
+            dtype=bool, count=len(self)
+        )
@@ -0,0 +1,93 @@
+import os
+import re
+import json
+
+DEFAULT_TAXONOMY_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "skills.json")
+
+# Word tokens, keeping the symbols that are part of tech names (c++, c#, .net, node.js)
+_TOKEN_RE = re.compile(r"\.?[a-z0-9+#]+(?:\.[a-z0-9+#]+)*")
+_END = None  # trie key marking the end of a term; never collides with a token
+
+def tokenize(text):
+    """Lowercased word tokens as seen by the skill matcher."""
+    return _TOKEN_RE.findall(text.lower())
+
+def load_taxonomy(path=DEFAULT_TAXONOMY_PATH):
+    """
+    Loads a skill taxonomy from a JSON file mapping each canonical skill ID
+    to a list of synonyms and aliases, e.g. {"kubernetes": ["k8s", "kube"]}.
+    """
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+class SkillMatcher:
+    """
+    Token trie compiled once from a taxonomy. Each document is scanned in a
+    single left-to-right pass taking the longest term at every position, so
+    the cost depends on document length and the longest alias, not on how
+    many skills the taxonomy holds.
+    """
+
+    def __init__(self, taxonomy):
+        self._root = {}
+        self.max_terms = 0
+        self.size = 0
+        for skill_id, aliases in taxonomy.items():
+            for term in [skill_id] + list(aliases):
+                self._add(term, skill_id)
+
+    @classmethod
+    def from_file(cls, path=DEFAULT_TAXONOMY_PATH):
+        return cls(load_taxonomy(path))
+
+    def _add(self, term, skill_id):
+        tokens = tokenize(term)
+        if not tokens:
+            return
+        node = self._root
+        for token in tokens:
+            node = node.setdefault(token, {})
+        node[_END] = skill_id
+        self.size += 1
+        self.max_terms = max(self.max_terms, len(tokens))
+
+    def match(self, text):
+        """Returns the set of canonical skill IDs mentioned in text."""
+        return self.match_tokens(tokenize(text))
+
+    def match_tokens(self, tokens):
+        """Same as match() for text that is already tokenized."""
+        found = set()
+        root = self._root
+        n = len(tokens)
+        i = 0
+        while i < n:
+            node = root.get(tokens[i])
+            if node is None:
+                i += 1
+                continue
+
+            # Walk the trie as far as the document allows, remembering the longest hit
+            skill_id, end = None, i + 1
+            j = i
+            while node is not None:
+                j += 1
+                if _END in node:
+                    skill_id, end = node[_END], j
+                if j >= n:
+                    break
+                node = node.get(tokens[j])
+
+            if skill_id is not None:
+                found.add(skill_id)
+            i = end
+        return found
+
+_default_matcher = None
+
+def get_default_matcher():
+    """The matcher for the bundled taxonomy, compiled on first use."""
+    global _default_matcher
+    if _default_matcher is None:
+        _default_matcher = SkillMatcher.from_file()
+    return _default_matcher
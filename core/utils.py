@@ -1,6 +1,8 @@
 import re
 import string
+from core.profiling import timed
 
+@timed("clean")
 def clean_text(text):
     """
     Cleans text by removing punctuation, extra whitespaces, and converting to lowercase.
@@ -0,0 +1,122 @@
+import os
+import joblib
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer, HashingVectorizer
+from core.document import as_document
+
+DEFAULT_VECTORIZER_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "models", "vectorizer.joblib")
+
+# pairwise - a TF-IDF fitted on just [jd, resume] per pair (the original scores)
+# corpus   - one TF-IDF fitted on the whole pool or a reference corpus, persisted
+# hashing  - stateless hashed term frequencies, fixed memory, nothing to fit
+VECTORIZER_MODES = ("pairwise", "corpus", "hashing")
+
+# Bumped whenever the term features change, so stale fitted models are refused
+VECTORIZER_VERSION = "1"
+
+HASHING_FEATURES = 2 ** 20
+
+def document_terms(doc):
+    """Analyzer handing scikit-learn the unigram + bigram terms of a ParsedDocument (or raw text)."""
+    return as_document(doc).terms.elements()
+
+class _TermVectorizer:
+    """Shared transform/similarity over L2-normalized rows."""
+
+    fitted = True
+
+    def transform(self, docs):
+        """Sparse L2-normalized term vectors, one row per document."""
+        return self._vectorizer.transform([as_document(d) for d in docs])
+
+    def similarity(self, job_vector, docs):
+        """Cosine similarity of one transformed JD against each document."""
+        if not docs:
+            return np.zeros(0)
+        return np.asarray((self.transform(docs) @ job_vector.T).todense()).ravel()
+
+class CorpusVectorizer(_TermVectorizer):
+    """
+    TF-IDF fitted once on a whole pool (or a reference corpus) so IDF weights
+    reflect how rare a term really is across candidates. The fitted model is
+    saved to disk and reloaded on the next run, and new resumes are only
+    transformed against the stored vocabulary, never refitted, so scores stay
+    comparable across runs.
+    """
+
+    def __init__(self, path=DEFAULT_VECTORIZER_PATH):
+        self.path = path
+        self.documents = 0
+        self._vectorizer = None
+
+    @property
+    def fitted(self):
+        return self._vectorizer is not None
+
+    @property
+    def vocabulary_size(self):
+        return len(self._vectorizer.vocabulary_) if self.fitted else 0
+
+    def fit(self, docs):
+        """
+        Fits the vocabulary and IDF weights on docs (ParsedDocuments or raw
+        text). docs may be a generator: it is consumed in a single pass, so
+        only the vocabulary, not the corpus, has to fit in memory.
+        """
+        seen = [0]
+
+        def counted():
+            for doc in docs:
+                seen[0] += 1
+                yield as_document(doc)
+
+        vectorizer = TfidfVectorizer(analyzer=document_terms)
+        try:
+            vectorizer.fit(counted())
+        except ValueError:
+            raise ValueError("cannot fit a vocabulary: the corpus has no terms") from None
+        self._vectorizer = vectorizer
+        self.documents = seen[0]
+        return self
+
+    def transform(self, docs):
+        if not self.fitted:
+            raise RuntimeError("CorpusVectorizer must be fitted or loaded before use")
+        return super().transform(docs)
+
+    def save(self, path=None):
+        path = path or self.path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        joblib.dump({"version": VECTORIZER_VERSION, "documents": self.documents, "vectorizer": self._vectorizer}, path)
+
+    @classmethod
+    def load(cls, path=DEFAULT_VECTORIZER_PATH):
+        """Loads a saved model; returns an unfitted instance if none exists or it is stale."""
+        instance = cls(path)
+        if os.path.exists(path):
+            state = joblib.load(path)
+            if state.get("version") == VECTORIZER_VERSION:
+                instance._vectorizer = state["vectorizer"]
+                instance.documents = state["documents"]
+        return instance
+
+class HashingTermVectorizer(_TermVectorizer):
+    """
+    Stateless hashed term frequencies: no vocabulary is kept, memory is fixed
+    by n_features whatever the pool size, and the same document always maps
+    to the same vector, so there is nothing to fit or persist.
+    """
+
+    def __init__(self, n_features=HASHING_FEATURES):
+        self._vectorizer = HashingVectorizer(analyzer=document_terms, n_features=n_features, alternate_sign=False)
+
+def get_vectorizer(mode, path=DEFAULT_VECTORIZER_PATH):
+    """Vectorizer for a VECTORIZER_MODES entry; None means the pairwise default."""
+    if mode == "corpus":
+        return CorpusVectorizer.load(path)
+    if mode == "hashing":
+        return HashingTermVectorizer()
+    if mode == "pairwise":
+        return None
+    raise ValueError(f"unknown vectorizer mode: {mode}")
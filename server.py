@@ -0,0 +1,432 @@
+"""
+Local HTTP scoring service for other internal tools.
+
+    python server.py --port 8008 --workers 4
+
+    POST /score   {"job_description": "...", "resume_text": "..."}
+                  {"job_description": "...", "file_name": "cv.pdf", "file_base64": "..."}
+                  optional "weights": [skills, experience, education]
+    GET  /health  queue depth, in-flight batches and request counters
+
+An asyncio front end accepts requests and hands them to a micro-batcher:
+concurrent requests for the same job description (and weights) are grouped
+for up to --batch-wait-ms and scored with one rank_candidates_batch call on a
+process pool, where files are parsed too. The waiting queue is bounded by
+--max-queue; once it is full new requests are turned away with 503 and a
+Retry-After header instead of piling up, and at most one batch per worker is
+in flight at a time. A batch that runs past --timeout (e.g. a PDF that hangs
+the parser) or a worker that dies gets the process pool replaced, so stuck
+workers never hold batch slots for good.
+"""
+import os
+import sys
+import json
+import time
+import base64
+import signal
+import asyncio
+import argparse
+import functools
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from core.parser import extract_text_from_bytes, EXTRACTION_MODES, SUPPORTED_TYPES
+from core.document import parse_document
+from core.analyzer import rank_candidates_batch
+from core.vectorizer import VECTORIZER_MODES, DEFAULT_VECTORIZER_PATH, get_vectorizer
+
+MAX_BODY_BYTES = 20 * 1024 * 1024
+REASONS = {
+    200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+    414: "URI Too Long", 422: "Unprocessable Entity", 431: "Request Header Fields Too Large",
+    500: "Internal Server Error", 503: "Service Unavailable", 504: "Gateway Timeout"
+}
+
+# Per-worker-process state, set up by _init_worker
+_worker = {}
+
+def _init_worker(extraction_mode, vectorizer_mode, vectorizer_path):
+    _worker["mode"] = extraction_mode
+    _worker["vectorizer"] = get_vectorizer(vectorizer_mode, vectorizer_path)
+
+@functools.lru_cache(maxsize=32)
+def _job_document(job_desc):
+    """Parsed JD, kept per worker so a JD hit by many batches is only normalized once."""
+    return parse_document(job_desc)
+
+def _score_batch(job_desc, weights, items):
+    """
+    Worker-side scoring of one micro-batch. items are ("text", resume_text)
+    or ("file", file_name, data); returns one result (None if the file could
+    not be parsed) per item.
+    """
+    texts = []
+    for item in items:
+        if item[0] == "file":
+            texts.append(extract_text_from_bytes(item[1], item[2], _worker.get("mode", "accurate")))
+        else:
+            texts.append(item[1])
+
+    parsed = [i for i, text in enumerate(texts) if text]
+    scored = rank_candidates_batch(
+        [texts[i] for i in parsed], _job_document(job_desc), weights, vectorizer=_worker.get("vectorizer")
+    )
+    results = [None] * len(items)
+    for i, result in zip(parsed, scored):
+        results[i] = result
+    return results
+
+class QueueFull(Exception):
+    pass
+
+def _terminate(executor):
+    """Shuts a process pool down without waiting for workers that may never finish."""
+    if hasattr(executor, "terminate_workers"):
+        executor.terminate_workers()
+        return
+    processes = list((getattr(executor, "_processes", None) or {}).values())
+    executor.shutdown(wait=False, cancel_futures=True)
+    for process in processes:
+        process.terminate()
+
+class MicroBatcher:
+    """
+    Groups queued scoring requests by (job description, weights) and runs
+    each group as one batch on the executor. The queue is the only buffer:
+    submit() fails fast once max_queue requests are waiting, and the batching
+    loop stops pulling from it while max_inflight batches are running.
+
+    A hung worker cannot be reclaimed, so when a batch runs longer than
+    timeout or the pool breaks, the executor is replaced with a fresh one
+    from make_executor; other batches that were running on the old pool are
+    retried once on the new one.
+    """
+
+    def __init__(self, make_executor, max_queue=256, max_batch=64, max_wait=0.005, max_inflight=1, timeout=60):
+        self.make_executor = make_executor
+        self.executor = make_executor()
+        self.timeout = timeout
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self.queue = asyncio.Queue(max_queue)
+        self._slots = asyncio.Semaphore(max_inflight)
+        self.inflight = 0
+        self.batches = 0
+        self.batched = 0
+        self.restarts = 0
+
+    def submit(self, key, item):
+        """Queues one item; returns a future for its result or raises QueueFull."""
+        future = asyncio.get_running_loop().create_future()
+        try:
+            self.queue.put_nowait((key, item, future))
+        except asyncio.QueueFull:
+            raise QueueFull() from None
+        return future
+
+    async def run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            await self._slots.acquire()
+            batch = [await self.queue.get()]
+            deadline = loop.time() + self.max_wait
+            while len(batch) < self.max_batch:
+                if not self.queue.empty():
+                    batch.append(self.queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self.queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            groups = {}
+            for key, item, future in batch:
+                if not future.done():
+                    groups.setdefault(key, []).append((item, future))
+            if not groups:
+                self._slots.release()
+                continue
+
+            # The slot taken above covers the first group; extra groups wait for theirs
+            first = True
+            for key, entries in groups.items():
+                if not first:
+                    await self._slots.acquire()
+                first = False
+                loop.create_task(self._run_group(key, entries))
+
+    async def _run_group(self, key, entries):
+        job_desc, weights = key
+        self.inflight += 1
+        try:
+            results = await self._score(job_desc, weights, [item for item, _ in entries])
+        except Exception as e:
+            for _, future in entries:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), result in zip(entries, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            self.inflight -= 1
+            self.batches += 1
+            self.batched += len(entries)
+            self._slots.release()
+
+    async def _score(self, job_desc, weights, items):
+        loop = asyncio.get_running_loop()
+        for attempt in range(2):
+            executor = self.executor
+            try:
+                return await asyncio.wait_for(
+                    loop.run_in_executor(executor, _score_batch, job_desc, weights, items), self.timeout
+                )
+            except asyncio.TimeoutError:
+                self._restart(executor)
+                raise TimeoutError(f"batch took longer than {self.timeout}s") from None
+            except BrokenProcessPool:
+                # Either this batch killed a worker or the pool was replaced
+                # under it because another batch hung; one retry tells them apart
+                self._restart(executor)
+                if attempt:
+                    raise
+
+    def _restart(self, executor):
+        """Replaces executor unless a concurrent failure already did."""
+        if self.executor is executor:
+            self.restarts += 1
+            self.executor = self.make_executor()
+            _terminate(executor)
+
+    def close(self):
+        _terminate(self.executor)
+
+class HttpError(Exception):
+    def __init__(self, status, message, headers=None):
+        super().__init__(message)
+        self.status = status
+        self.headers = headers or {}
+
+async def _read_line(reader, status):
+    """One CRLF-terminated line; a line over the stream limit (64 KiB) becomes HttpError(status)."""
+    try:
+        return await reader.readline()
+    except ValueError:
+        # LimitOverrunError: the rest of the line is still unread, so the connection is closed after this
+        raise HttpError(status, "line too long") from None
+
+async def read_request(reader):
+    """Reads one HTTP/1.1 request; returns (method, path, headers, body) or None at EOF."""
+    line = await _read_line(reader, 414)
+    if not line or not line.strip():
+        return None
+    try:
+        method, target, _ = line.decode("latin-1").split(" ", 2)
+    except ValueError:
+        raise HttpError(400, "malformed request line") from None
+
+    headers = {}
+    while True:
+        line = await _read_line(reader, 431)
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        length = int(headers.get("content-length") or 0)
+    except ValueError:
+        raise HttpError(400, "invalid Content-Length") from None
+    if length > MAX_BODY_BYTES:
+        raise HttpError(413, f"request body over {MAX_BODY_BYTES} bytes")
+    body = await reader.readexactly(length) if length else b""
+    return method.upper(), target.split("?", 1)[0], headers, body
+
+def write_response(writer, status, payload, keep_alive=True, headers=None):
+    body = json.dumps(payload).encode("utf-8")
+    lines = [
+        f"HTTP/1.1 {status} {REASONS.get(status, '')}",
+        "Content-Type: application/json",
+        f"Content-Length: {len(body)}",
+        f"Connection: {'keep-alive' if keep_alive else 'close'}"
+    ]
+    lines += [f"{name}: {value}" for name, value in (headers or {}).items()]
+    writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body)
+
+class ScoringService:
+    """HTTP routing and request validation in front of a MicroBatcher."""
+
+    def __init__(self, batcher, timeout=60):
+        self.batcher = batcher
+        self.timeout = timeout
+        self.started = time.time()
+        self.requests = 0
+        self.rejected = 0
+        self.errors = 0
+
+    async def handle(self, reader, writer):
+        """One client connection; serves requests until the client closes it."""
+        try:
+            while True:
+                try:
+                    request = await read_request(reader)
+                except HttpError as e:
+                    # The rest of the stream can't be trusted after a bad request
+                    write_response(writer, e.status, {"error": str(e)}, keep_alive=False)
+                    await writer.drain()
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    status, payload, extra = await self.dispatch(method, path, body)
+                except HttpError as e:
+                    status, payload, extra = e.status, {"error": str(e)}, e.headers
+                write_response(writer, status, payload, keep_alive, extra)
+                await writer.drain()
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def dispatch(self, method, path, body):
+        if path == "/health":
+            if method != "GET":
+                raise HttpError(405, "use GET")
+            return 200, self.health(), None
+        if path == "/score":
+            if method != "POST":
+                raise HttpError(405, "use POST")
+            return await self.score(body)
+        raise HttpError(404, f"no route for {path}")
+
+    async def score(self, body):
+        self.requests += 1
+        key, item = _parse_score_request(body)
+        try:
+            future = self.batcher.submit(key, item)
+        except QueueFull:
+            self.rejected += 1
+            raise HttpError(503, "scoring queue is full, retry later", {"Retry-After": "1"}) from None
+
+        try:
+            result = await asyncio.wait_for(future, self.timeout)
+        except asyncio.TimeoutError:
+            self.errors += 1
+            raise HttpError(504, f"scoring took longer than {self.timeout}s") from None
+        except Exception as e:
+            self.errors += 1
+            raise HttpError(500, f"scoring failed: {e}") from None
+
+        if result is None:
+            raise HttpError(422, "could not extract text from the file")
+        return 200, result, None
+
+    def health(self):
+        batcher = self.batcher
+        return {
+            "status": "ok",
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "queue_depth": batcher.queue.qsize(),
+            "max_queue": batcher.queue.maxsize,
+            "inflight_batches": batcher.inflight,
+            "requests": self.requests,
+            "rejected": self.rejected,
+            "errors": self.errors,
+            "batches": batcher.batches,
+            "mean_batch_size": round(batcher.batched / batcher.batches, 2) if batcher.batches else 0.0,
+            "pool_restarts": batcher.restarts
+        }
+
+def _parse_score_request(body):
+    """Validates a /score body; returns the batching key and the worker item."""
+    try:
+        data = json.loads(body or b"{}")
+    except (ValueError, UnicodeDecodeError):
+        raise HttpError(400, "body must be JSON") from None
+    if not isinstance(data, dict):
+        raise HttpError(400, "body must be a JSON object")
+
+    job_desc = data.get("job_description")
+    if not isinstance(job_desc, str) or not job_desc.strip():
+        raise HttpError(400, "job_description is required")
+
+    weights = data.get("weights", (50, 30, 20))
+    if (not isinstance(weights, (list, tuple)) or len(weights) != 3
+            or not all(isinstance(w, (int, float)) and not isinstance(w, bool) for w in weights)):
+        raise HttpError(400, "weights must be three numbers")
+
+    if isinstance(data.get("resume_text"), str):
+        item = ("text", data["resume_text"])
+    elif isinstance(data.get("file_base64"), str):
+        file_name = data.get("file_name") or ""
+        if os.path.splitext(file_name)[1].lower().lstrip(".") not in SUPPORTED_TYPES:
+            raise HttpError(400, f"file_name must be a {' or '.join(SUPPORTED_TYPES)} file")
+        try:
+            item = ("file", file_name, base64.b64decode(data["file_base64"], validate=True))
+        except ValueError:
+            raise HttpError(400, "file_base64 is not valid base64") from None
+    else:
+        raise HttpError(400, "resume_text or file_name + file_base64 is required")
+
+    return (job_desc, tuple(weights)), item
+
+async def serve(args):
+    vectorizer = get_vectorizer(args.vectorizer, args.vectorizer_path)
+    if vectorizer is not None and not vectorizer.fitted:
+        raise SystemExit(f"No fitted vectorizer at {args.vectorizer_path}; fit one with cli.py --vectorizer corpus first.")
+
+    workers = args.workers or os.cpu_count() or 1
+    make_executor = functools.partial(
+        ProcessPoolExecutor,
+        max_workers=workers, initializer=_init_worker, initargs=(args.mode, args.vectorizer, args.vectorizer_path)
+    )
+    batcher = MicroBatcher(
+        make_executor, max_queue=args.max_queue, max_batch=args.max_batch,
+        max_wait=args.batch_wait_ms / 1000, max_inflight=workers, timeout=args.timeout
+    )
+    service = ScoringService(batcher, timeout=args.timeout)
+    batch_loop = asyncio.create_task(batcher.run())
+    server = await asyncio.start_server(service.handle, args.host, args.port, backlog=args.max_queue)
+    print(f"Scoring service on http://{args.host}:{args.port} ({workers} workers)", file=sys.stderr)
+    stop = asyncio.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            asyncio.get_running_loop().add_signal_handler(sig, stop.set)
+        except NotImplementedError:
+            # Windows: Ctrl+C still interrupts asyncio.run
+            pass
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        batch_loop.cancel()
+        batcher.close()
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve resume scoring over local HTTP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8008)
+    parser.add_argument("--workers", type=int, default=None, help="scoring processes (default: CPU count)")
+    parser.add_argument("--max-queue", type=int, default=256, help="requests allowed to wait before new ones get 503")
+    parser.add_argument("--max-batch", type=int, default=64, help="most requests scored in one batch")
+    parser.add_argument("--batch-wait-ms", type=float, default=5, help="how long a batch waits to fill up")
+    parser.add_argument("--timeout", type=float, default=60, help="per-request and per-batch scoring timeout in seconds")
+    parser.add_argument("--mode", choices=EXTRACTION_MODES, default="accurate", help="text extraction mode for files")
+    parser.add_argument("--vectorizer", choices=VECTORIZER_MODES, default="pairwise", help="how resume/JD term vectors are weighted")
+    parser.add_argument("--vectorizer-path", default=DEFAULT_VECTORIZER_PATH, help="fitted model location for --vectorizer corpus")
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
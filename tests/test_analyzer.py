@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+from benchmarks.corpus import resume_text, job_description
+from core.analyzer import prepare_job, rank_candidates_batch, rank_candidates_matrix, score_resume
+from core.utils import clean_text
+
+RESUMES = [resume_text(i, words=200 + 20 * i) for i in range(30)] + [
+    "",
+    "   \n\x0c ",
+    "the and of to in is it",  # stop words only
+    "C++ C# .NET; Python!! python, PYTHON... 7 yrs",
+    "Kubernetes",
+    "résumé: développeur Python, 4 years",
+]
+JDS = [job_description(0), job_description(1, words=60), "Python developer with AWS and Docker, 5+ years", "the of and"]
+
+def pairwise_tfidf_cosine(resume, jd):
+    """The original scorer: a TfidfVectorizer fitted on just [jd, resume]."""
+    vectorizer = TfidfVectorizer(stop_words="english", ngram_range=(1, 2))
+    try:
+        matrix = vectorizer.fit_transform([clean_text(jd), clean_text(resume)])
+    except ValueError:
+        # Neither document has a single term
+        return 0.0
+    return cosine_similarity(matrix[0:1], matrix[1:2])[0][0]
+
+@pytest.fixture(scope="module")
+def expected():
+    return np.array([[pairwise_tfidf_cosine(r, jd) for jd in JDS] for r in RESUMES])
+
+@pytest.mark.parametrize("j", range(len(JDS)))
+def test_batch_matches_pairwise_tfidf(expected, j):
+    results = rank_candidates_batch(RESUMES, JDS[j])
+    sims = [r["components"]["similarity"] for r in results]
+    np.testing.assert_allclose(sims, expected[:, j], rtol=0, atol=1e-12)
+
+@pytest.mark.parametrize("j", range(len(JDS)))
+def test_score_resume_matches_pairwise_tfidf(expected, j):
+    job = prepare_job(JDS[j])
+    sims = [score_resume(job, r)["components"]["similarity"] for r in RESUMES]
+    np.testing.assert_allclose(sims, expected[:, j], rtol=0, atol=1e-12)
+
+def test_matrix_columns_match_pairwise_tfidf_and_batch(expected):
+    matrix = rank_candidates_matrix(iter(RESUMES), JDS, chunk_size=7)
+    np.testing.assert_allclose(matrix["similarity"], expected, rtol=0, atol=1e-12)
+    for j, jd in enumerate(JDS):
+        assert list(matrix["score"][:, j]) == [r["score"] for r in rank_candidates_batch(RESUMES, jd)]
@@ -0,0 +1,38 @@
+import sqlite3
+from core.cache import ExtractionCache
+
+def _stored_bytes(cache):
+    return cache._conn.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+
+def test_running_total_tracks_inserts_replacements_and_evictions():
+    cache = ExtractionCache(":memory:", max_bytes=100)
+    cache.put("a", "x" * 40)
+    cache.put("b", "x" * 40)
+    cache.put("a", "x" * 10)
+    assert cache.stats()["bytes"] == _stored_bytes(cache) == 50
+    cache.put("c", "x" * 80)
+    assert cache.stats()["bytes"] == _stored_bytes(cache) <= 100
+    cache.clear()
+    assert cache.stats()["bytes"] == 0
+
+def test_recent_hits_survive_eviction():
+    cache = ExtractionCache(":memory:", max_bytes=30)
+    for key in "abc":
+        cache.put(key, "x" * 10)
+    assert cache.get("a") is not None  # only touched in memory so far
+    cache.put("d", "x" * 10)
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.stats()["evictions"] == 1
+
+def test_existing_store_gets_its_total_on_open(tmp_path):
+    path = str(tmp_path / "old.sqlite3")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE extractions (key TEXT PRIMARY KEY, text TEXT NOT NULL, size INTEGER NOT NULL, last_used REAL NOT NULL)")
+    conn.execute("INSERT INTO extractions VALUES ('k', 'text', 4, 0)")
+    conn.commit()
+    conn.close()
+    cache = ExtractionCache(path)
+    assert cache.stats()["bytes"] == 4
+    assert cache.get("k") == "text"
+    cache.close()
@@ -0,0 +1,18 @@
+from benchmarks.corpus import resume_text
+from core.dedup import DuplicateDetector
+from core.document import parse_document
+
+def test_exact_copy_of_a_near_duplicate_joins_the_cluster_leader():
+    a = resume_text(0, words=300)
+    b = a.replace("Senior Software Engineer", "Senior Backend Engineer", 1) + "\nReferences available on request."
+    detector = DuplicateDetector()
+    assert detector.add(0, parse_document(a)) == 0
+    assert detector.add(1, parse_document(b)) == 0
+    assert detector.add(2, parse_document(b)) == 0
+    assert detector.clusters() == {0: [0, 1, 2]}
+
+def test_documents_without_text_are_never_collapsed():
+    detector = DuplicateDetector()
+    for key, raw in enumerate(["", "\x0c\x0c", " \n ", "- - -", "two words"]):
+        assert detector.add(key, parse_document(raw)) == key
+        assert detector.add(key + 10, raw) == key + 10
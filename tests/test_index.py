@@ -0,0 +1,33 @@
+import pytest
+from benchmarks.corpus import resume_text, job_description
+from core.analyzer import rank_candidates
+from core.index import CandidateIndex
+
+RESUMES = [resume_text(i, words=250) for i in range(40)] + ["", "the and of", "Python developer, 3 yrs of AWS."]
+
+@pytest.fixture
+def index():
+    index = CandidateIndex(":memory:")
+    index.add_many((f"c{i}", text, f"resume_{i}.pdf") for i, text in enumerate(RESUMES))
+    yield index
+    index.close()
+
+@pytest.mark.parametrize("jd", [job_description(0), job_description(3, words=40), "Senior C# .NET engineer, 8+ years"])
+def test_query_matches_rank_candidates(index, jd):
+    weights = (40, 40, 20)
+    results = {r["id"]: r for r in index.query(jd, weights=weights, top_k=len(RESUMES))}
+    assert len(results) == len(RESUMES)
+    for i, text in enumerate(RESUMES):
+        expected = rank_candidates(text, jd, weights)
+        got = results[f"c{i}"]
+        assert got["score"] == expected["score"]
+        assert got["components"]["similarity"] == pytest.approx(expected["components"]["similarity"], abs=1e-12)
+        assert sorted(got["skills"]) == sorted(expected["skills"])
+        assert sorted(got["missing_skills"]) == sorted(expected["missing_skills"])
+        assert got["seniority_level"] == expected["seniority_level"]
+
+def test_query_returns_the_best_first(index):
+    results = index.query(job_description(1), top_k=5)
+    scores = [r["score"] for r in results]
+    assert len(results) == 5 and scores == sorted(scores, reverse=True)
+    assert scores[0] == max(rank_candidates(t, job_description(1))["score"] for t in RESUMES)
@@ -0,0 +1,31 @@
+import threading
+from core.document import parse_document
+from core.profiling import PROFILER, Profiler, use_profiler
+
+def test_skill_matching_is_timed_inside_normalization():
+    with use_profiler(Profiler()) as profiler:
+        profiler.enable()
+        parse_document("Python and C# developer")
+    stages = profiler.snapshot()["stages"]
+    assert stages["normalize"]["calls"] == stages["skills"]["calls"] == 1
+
+def test_scoped_profilers_do_not_see_each_other():
+    ready = threading.Barrier(2)
+    profilers = {}
+
+    def run(name, docs):
+        with use_profiler(Profiler()) as profiler:
+            profiler.enable()
+            ready.wait()
+            for _ in range(docs):
+                parse_document("Python developer")
+            profilers[name] = profiler
+
+    threads = [threading.Thread(target=run, args=("a", 3)), threading.Thread(target=run, args=("b", 5))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert profilers["a"].snapshot()["stages"]["normalize"]["calls"] == 3
+    assert profilers["b"].snapshot()["stages"]["normalize"]["calls"] == 5
+    assert not PROFILER.enabled
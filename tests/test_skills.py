@@ -0,0 +1,19 @@
+from core.analyzer import rank_candidates
+from core.document import parse_document
+from core.skills import SkillMatcher
+
+PUNCTUATED = {"c++", "c#", ".net", "objective-c"}
+
+def test_punctuated_skill_ids_survive_normalization():
+    doc = parse_document("Built services in C++, C#, .NET Core and Objective-C; shipped on .NET.")
+    assert PUNCTUATED <= doc.skills
+
+def test_punctuated_skills_are_matched_and_reported_missing():
+    result = rank_candidates("Expert in C++, C#, .NET, Node.js and CI/CD", "Need C++ C# .NET Node.js CI/CD Objective-C developer")
+    assert {"c++", "c#", ".net", "ci/cd"} <= set(result["skills"])
+    assert result["missing_skills"] == ["objective-c"]
+
+def test_symbols_only_match_whole_tokens():
+    matcher = SkillMatcher({"c++": [], "c#": [], "c": []})
+    assert matcher.match("C, not C++ or C#") == {"c", "c++", "c#"}
+    assert matcher.match("plain c") == {"c"}